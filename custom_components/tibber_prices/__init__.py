@@ -7,24 +7,21 @@ https://github.com/jpawlowski/tibber_prices2
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from datetime import timedelta
+from typing import TYPE_CHECKING, Final
+
+import aiohttp
 
 from homeassistant.const import CONF_ACCESS_TOKEN, Platform
-from homeassistant.core import callback
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
-from homeassistant.helpers.event import async_track_time_change
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
+from homeassistant.helpers.event import async_track_point_in_time
 from homeassistant.loader import async_get_loaded_integration
-
-if TYPE_CHECKING:
-    from datetime import datetime
-
-    from homeassistant.config_entries import ConfigEntry
-    from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
 
 from .api import TibberPricesApiClient
 from .const import (
     CONF_HOME_ID,
-    DOMAIN,
     LOGGER,
 )
 from .coordinator import TibberPricesDataUpdateCoordinator
@@ -33,12 +30,17 @@ from .data import TibberPricesData
 if TYPE_CHECKING:
     from datetime import datetime
 
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
     from homeassistant.helpers.typing import ConfigType
 
-PLATFORMS: list[Platform] = [
+PLATFORMS: Final[tuple[Platform, ...]] = (
     Platform.SENSOR,
     Platform.BINARY_SENSOR,
-]
+)
+
+# Safety margin so a timer firing marginally early does not target the same midnight twice
+MIDNIGHT_TIMER_MARGIN = timedelta(minutes=1)
 
 
 async def async_setup(_hass: HomeAssistant, _config: ConfigType) -> bool:
@@ -48,12 +50,13 @@ async def async_setup(_hass: HomeAssistant, _config: ConfigType) -> bool:
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up this integration using UI."""
-    hass.data.setdefault(DOMAIN, {})
+    # Create a dedicated session so Tibber requests do not share cookies with other integrations
+    session = async_create_clientsession(hass, cookie_jar=aiohttp.DummyCookieJar())
 
     # Create API client using access token
     client = TibberPricesApiClient(
         access_token=entry.data[CONF_ACCESS_TOKEN],
-        session=async_get_clientsession(hass),
+        session=session,
     )
 
     # Create coordinator
@@ -70,8 +73,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         coordinator=coordinator,
     )
 
-    # Store runtime data in hass.data
-    hass.data[DOMAIN][entry.entry_id] = runtime_data
+    # Store runtime data on the config entry
+    entry.runtime_data = runtime_data
 
     # Set config entry reference in coordinator
     coordinator.config_entry = entry
@@ -79,15 +82,31 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Initialize the coordinator - load cached data before first refresh
     await coordinator.async_initialize()
 
-    # Create listener for midnight transition
+    # Create self-rescheduling timer for midnight transition
+    remove_midnight_listener: CALLBACK_TYPE | None = None
+
     @callback
     def _handle_midnight(_: datetime) -> None:
-        """Handle midnight transition."""
+        """Handle midnight transition and arm the timer for the next one."""
+        nonlocal remove_midnight_listener
         LOGGER.debug("Handling midnight data transition")
         coordinator.async_handle_midnight_transition()
+        remove_midnight_listener = async_track_point_in_time(
+            hass,
+            _handle_midnight,
+            _next_midnight(dt_util.now() + MIDNIGHT_TIMER_MARGIN),
+        )
 
-    # Register midnight listener
-    remove_midnight_listener = async_track_time_change(hass, _handle_midnight, hour=0, minute=0, second=0)
+    @callback
+    def _cancel_midnight_listener() -> None:
+        """Cancel the pending midnight timer."""
+        if remove_midnight_listener is not None:
+            remove_midnight_listener()
+
+    # Register midnight timer
+    remove_midnight_listener = async_track_point_in_time(hass, _handle_midnight, _next_midnight(dt_util.now()))
+    # Registered right away so the timer is also cancelled when the first refresh fails and setup is retried
+    entry.async_on_unload(_cancel_midnight_listener)
 
     # Initial data fetch - will only call API if needed
     await coordinator.async_config_entry_first_refresh()
@@ -97,7 +116,6 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     # Register cleanup listeners
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
-    entry.async_on_unload(remove_midnight_listener)
 
     return True
 
@@ -108,16 +126,11 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         return False
 
     # Clean up any scheduled tasks in the coordinator
-    if DOMAIN in hass.data and entry.entry_id in hass.data[DOMAIN]:
-        runtime_data = hass.data[DOMAIN][entry.entry_id]
-        coordinator = runtime_data.coordinator
-
-        # Call cancel_scheduled_updates method if it exists
-        if hasattr(coordinator, "cancel_scheduled_updates"):
-            coordinator.cancel_scheduled_updates()
-
-        # Remove the data from hass.data
-        hass.data[DOMAIN].pop(entry.entry_id)
+    coordinator = entry.runtime_data.coordinator
+    if coordinator is not None:
+        coordinator.cancel_scheduled_updates()
+        # Persist pending cache changes before a reload creates a new coordinator that loads them
+        await coordinator.async_flush_cache()
 
     return True
 
@@ -125,3 +138,13 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload config entry."""
     await hass.config_entries.async_reload(entry.entry_id)
+
+
+def _next_midnight(reference: datetime) -> datetime:
+    """
+    Return the first local midnight after the reference time.
+
+    The timer is armed with this absolute instant rather than a delay, as subtracting two local
+    datetimes ignores the UTC offset change on DST transition days.
+    """
+    return dt_util.start_of_local_day(reference.date() + timedelta(days=1))
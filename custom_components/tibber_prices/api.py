@@ -3,21 +3,53 @@
 from __future__ import annotations
 
 import asyncio
+import secrets
 import socket
-from typing import Any
+from email.utils import parsedate_to_datetime
+from typing import Any, Final
 
 import aiohttp
 import async_timeout
+from multidict import CIMultiDict
+
+from homeassistant.helpers.json import json_bytes
+from homeassistant.util import dt as dt_util
+from homeassistant.util.json import json_loads
 
 from .const import (
     DEFAULT_TIMEOUT,
     HTTP_RATE_LIMIT_TOO_MANY_REQUESTS,
     LOGGER,
     MAX_RETRIES,
+    MAX_RETRY_AFTER,
+    QUERY_ALL_PRICES,
+    QUERY_DAILY_PRICE_RATING,
+    QUERY_HOURLY_PRICE_RATING,
+    QUERY_MONTHLY_PRICE_RATING,
+    QUERY_PRICE_INFO,
+    QUERY_PRICES_HOURLY_RATING,
+    QUERY_USER_INFO,
     RETRY_DELAY,
     TIBBER_API_URL,
 )
 
+# Jitter source for retry delays, spreads out retries of concurrent installations
+_RANDOM = secrets.SystemRandom()
+
+# Request bodies of the static queries, serialized once at import time
+_QUERY_PAYLOADS: Final[dict[str, bytes]] = {
+    query: json_bytes({"query": query})
+    for query in (
+        QUERY_USER_INFO,
+        QUERY_PRICE_INFO,
+        QUERY_ALL_PRICES,
+        QUERY_PRICES_HOURLY_RATING,
+        QUERY_DAILY_PRICE_RATING,
+        QUERY_HOURLY_PRICE_RATING,
+        QUERY_MONTHLY_PRICE_RATING,
+    )
+}
+
 
 class TibberPricesApiClientError(Exception):
     """Exception to indicate a general API error."""
@@ -34,18 +66,63 @@ class TibberPricesApiClientAuthenticationError(TibberPricesApiClientError):
 class TibberPricesApiClientRateLimitError(TibberPricesApiClientError):
     """Exception to indicate a rate limit error."""
 
+    def __init__(self, message: str, retry_after: float | None = None) -> None:
+        """
+        Initialize the rate limit error.
+
+        Args:
+            message: The error message
+            retry_after: Seconds to wait before retrying as requested by the API, if provided
+
+        """
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+# Exception type and message for HTTP status codes that need dedicated handling
+_STATUS_ERRORS: Final[dict[int, tuple[type[TibberPricesApiClientError], str]]] = {
+    401: (TibberPricesApiClientAuthenticationError, "Invalid access token or unauthorized access"),
+    403: (TibberPricesApiClientAuthenticationError, "Invalid access token or unauthorized access"),
+    HTTP_RATE_LIMIT_TOO_MANY_REQUESTS: (TibberPricesApiClientRateLimitError, "Rate limit exceeded"),
+}
+
 
 def _verify_response_or_raise(response: aiohttp.ClientResponse) -> None:
     """Verify that the response is valid."""
-    if response.status in (401, 403):
-        msg = "Invalid access token or unauthorized access"
-        raise TibberPricesApiClientAuthenticationError(msg)
+    error = _STATUS_ERRORS.get(response.status)
+    if error is None:
+        response.raise_for_status()
+        return
+
+    exception_type, msg = error
+    if exception_type is TibberPricesApiClientRateLimitError:
+        raise TibberPricesApiClientRateLimitError(msg, _parse_retry_after(response.headers.get("Retry-After")))
+    raise exception_type(msg)
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header given in seconds or as HTTP date into seconds to wait."""
+    if not value:
+        return None
 
-    if response.status == HTTP_RATE_LIMIT_TOO_MANY_REQUESTS:
-        msg = "Rate limit exceeded"
-        raise TibberPricesApiClientRateLimitError(msg)
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
 
-    response.raise_for_status()
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=dt_util.UTC)
+    return max((retry_at - dt_util.utcnow()).total_seconds(), 0.0)
+
+
+def _get_retry_delay(attempt: int) -> float:
+    """Return the exponential backoff delay for a retry attempt with up to 100% random jitter added."""
+    backoff = RETRY_DELAY * (2 ** (attempt - 1))
+    return backoff + _RANDOM.uniform(0, backoff)
 
 
 class TibberPricesApiClient:
@@ -66,10 +143,14 @@ class TibberPricesApiClient:
         """
         self._access_token = access_token
         self._session = session
-        self._headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json",
-        }
+        # No Accept-Encoding header on purpose: aiohttp negotiates gzip/deflate (and brotli when
+        # available) by default and decompresses the responses transparently
+        self._headers = CIMultiDict(
+            {
+                "Authorization": f"Bearer {access_token}",
+                "Content-Type": "application/json",
+            }
+        )
 
     async def async_get_user_info(self) -> dict[str, Any]:
         """
@@ -79,27 +160,7 @@ class TibberPricesApiClient:
             Dict containing user information and homes
 
         """
-        query = """
-            {
-                viewer {
-                    userId
-                    name
-                    login
-                    homes {
-                        id
-                        type
-                        appNickname
-                        address {
-                            address1
-                            postalCode
-                            city
-                            country
-                        }
-                    }
-                }
-            }
-        """
-        return await self._execute_graphql_query(query)
+        return await self._execute_graphql_query(QUERY_USER_INFO, "GraphQL user info query")
 
     async def async_get_price_info(self) -> dict[str, Any]:
         """
@@ -109,16 +170,27 @@ class TibberPricesApiClient:
             Dict containing price information for all homes
 
         """
-        query = """
-            {viewer{homes{id,currentSubscription{priceInfo{
-                range(resolution:HOURLY,last:48){edges{node{
-                    startsAt total energy tax level
-                }}}
-                today{startsAt total energy tax level}
-                tomorrow{startsAt total energy tax level}
-            }}}}}
+        return await self._execute_graphql_query(QUERY_PRICE_INFO, "GraphQL price info query")
+
+    async def async_get_all_prices(self) -> dict[str, Any]:
+        """
+        Get price info and all price ratings for all homes in a single request.
+
+        Returns:
+            Dict containing price information and daily, hourly and monthly price ratings for all homes
+
+        """
+        return await self._execute_graphql_query(QUERY_ALL_PRICES, "GraphQL combined price query")
+
+    async def async_get_prices_with_hourly_rating(self) -> dict[str, Any]:
         """
-        return await self._execute_graphql_query(query)
+        Get price info and the hourly price rating for all homes in a single request.
+
+        Returns:
+            Dict containing price information and hourly price rating for all homes
+
+        """
+        return await self._execute_graphql_query(QUERY_PRICES_HOURLY_RATING, "GraphQL price and hourly rating query")
 
     async def async_get_daily_price_rating(self) -> dict[str, Any]:
         """
@@ -128,16 +200,7 @@ class TibberPricesApiClient:
             Dict containing daily price rating for all homes
 
         """
-        query = """
-            {viewer{homes{id,currentSubscription{priceRating{
-                thresholdPercentages{low high}
-                daily{
-                    currency
-                    entries{time total energy tax difference level}
-                }
-            }}}}}
-        """
-        return await self._execute_graphql_query(query)
+        return await self._execute_graphql_query(QUERY_DAILY_PRICE_RATING, "GraphQL daily price rating query")
 
     async def async_get_hourly_price_rating(self) -> dict[str, Any]:
         """
@@ -147,16 +210,7 @@ class TibberPricesApiClient:
             Dict containing hourly price rating for all homes
 
         """
-        query = """
-            {viewer{homes{id,currentSubscription{priceRating{
-                thresholdPercentages{low high}
-                hourly{
-                    currency
-                    entries{time total energy tax difference level}
-                }
-            }}}}}
-        """
-        return await self._execute_graphql_query(query)
+        return await self._execute_graphql_query(QUERY_HOURLY_PRICE_RATING, "GraphQL hourly price rating query")
 
     async def async_get_monthly_price_rating(self) -> dict[str, Any]:
         """
@@ -166,23 +220,20 @@ class TibberPricesApiClient:
             Dict containing monthly price rating for all homes
 
         """
-        query = """
-            {viewer{homes{id,currentSubscription{priceRating{
-                thresholdPercentages{low high}
-                monthly{
-                    currency
-                    entries{time total energy tax difference level}
-                }
-            }}}}}
-        """
-        return await self._execute_graphql_query(query)
+        return await self._execute_graphql_query(QUERY_MONTHLY_PRICE_RATING, "GraphQL monthly price rating query")
 
-    async def _execute_graphql_query(self, query: str, variables: dict[str, Any] | None = None) -> dict[str, Any]:
+    async def _execute_graphql_query(
+        self,
+        query: str,
+        query_type: str,
+        variables: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
         """
         Execute a GraphQL query with retry logic.
 
         Args:
             query: The GraphQL query to execute
+            query_type: Human-readable label of the query used for logging
             variables: Optional variables for the GraphQL query
 
         Returns:
@@ -192,99 +243,69 @@ class TibberPricesApiClient:
             TibberPricesApiClientError: If the query fails after all retries
 
         """
-        # Extract a more meaningful identifier from the query for logging
-        query_type = self._identify_query_type(query)
         LOGGER.debug("Executing %s", query_type)
 
-        data: dict[str, Any] = {"query": query}
         if variables:
-            data["variables"] = variables
-
-        return await self._execute_with_retry(data)
-
-    def _identify_query_type(self, query: str) -> str:
-        """Identify the type of GraphQL query from its content."""
-        query_single_line = " ".join(query.split())
-
-        if "priceInfo" in query_single_line:
-            return "GraphQL price info query"
-
-        if "priceRating" in query_single_line:
-            return self._identify_price_rating_query_type(query_single_line)
-
-        if "userId" in query_single_line and "homes" in query_single_line:
-            return "GraphQL user info query"
-
-        return "GraphQL query"
-
-    def _identify_price_rating_query_type(self, query_single_line: str) -> str:
-        """Identify specific price rating query types."""
-        if "daily" in query_single_line and "hourly" not in query_single_line and "monthly" not in query_single_line:
-            return "GraphQL daily price rating query"
-
-        if "hourly" in query_single_line and "daily" not in query_single_line:
-            return "GraphQL hourly price rating query"
+            body = json_bytes({"query": query, "variables": variables})
+        else:
+            body = _QUERY_PAYLOADS.get(query) or json_bytes({"query": query})
 
-        if "monthly" in query_single_line and "daily" not in query_single_line:
-            return "GraphQL monthly price rating query"
+        return await self._execute_with_retry(body)
 
-        return "GraphQL price rating query"
+    async def _execute_with_retry(self, body: bytes) -> dict[str, Any]:
+        """Execute the GraphQL query, retrying transient errors with jittered exponential backoff."""
+        # Only the message of the last failure is kept so failed attempts don't pin tracebacks in memory
+        last_error = "no attempt made"
 
-    async def _execute_with_retry(self, data: dict[str, Any]) -> dict[str, Any]:
-        """Execute the GraphQL query with retry logic."""
-        retry_count = 0
-        last_exception = None
-
-        while retry_count < MAX_RETRIES:
+        for attempt in range(1, MAX_RETRIES + 1):
             try:
-                return await self._try_execute_query(data)
-
-            except TibberPricesApiClientRateLimitError as exception:
-                last_exception = exception
-                wait_time = RETRY_DELAY * (2**retry_count)
-                LOGGER.warning(
-                    "Rate limit exceeded, retrying in %s seconds (attempt %s/%s)",
-                    wait_time,
-                    retry_count + 1,
-                    MAX_RETRIES,
-                )
-                await asyncio.sleep(wait_time)
-
-            except TibberPricesApiClientCommunicationError as exception:
-                last_exception = exception
-                wait_time = RETRY_DELAY * (retry_count + 1)
-                LOGGER.warning(
-                    "Communication error, retrying in %s seconds (attempt %s/%s): %s",
-                    wait_time,
-                    retry_count + 1,
-                    MAX_RETRIES,
-                    exception,
-                )
-                await asyncio.sleep(wait_time)
+                return await self._try_execute_query(body)
 
             except TibberPricesApiClientAuthenticationError:
                 # Don't retry authentication errors
                 raise
 
+            except TibberPricesApiClientRateLimitError as exception:
+                last_error = str(exception)
+                reason = "Rate limit exceeded"
+                retry_after = exception.retry_after
+                if retry_after is not None and retry_after > MAX_RETRY_AFTER:
+                    # Sleeping that long would stall the update; let the coordinator fall back to cached data
+                    LOGGER.warning("Rate limit exceeded, Retry-After of %.1f seconds is too long to wait", retry_after)
+                    raise
+
+            except TibberPricesApiClientCommunicationError as exception:
+                last_error = str(exception)
+                reason = f"Communication error ({exception})"
+                retry_after = None
+
             except (aiohttp.ClientError, socket.gaierror, TimeoutError) as exception:
                 # Handle specific errors we know can happen
                 LOGGER.error("Error in GraphQL query: %s", exception)
-                last_exception = exception
+                last_error = str(exception) or type(exception).__name__
+                continue
 
-            retry_count += 1
+            if attempt < MAX_RETRIES:
+                wait_time = min(retry_after, MAX_RETRY_AFTER) if retry_after is not None else _get_retry_delay(attempt)
+                LOGGER.warning(
+                    "%s, retrying in %.1f seconds (attempt %s/%s)",
+                    reason,
+                    wait_time,
+                    attempt,
+                    MAX_RETRIES,
+                )
+                await asyncio.sleep(wait_time)
 
         # If we get here, all retries have failed
-        msg = f"Failed to execute GraphQL query after {MAX_RETRIES} attempts"
-        if last_exception:
-            raise TibberPricesApiClientError(msg) from last_exception
-        raise TibberPricesApiClientError(msg)
+        msg = f"Failed to execute GraphQL query after {MAX_RETRIES} attempts: {last_error}"
+        raise TibberPricesApiClientError(msg) from None
 
-    async def _try_execute_query(self, data: dict[str, Any]) -> dict[str, Any]:
+    async def _try_execute_query(self, body: bytes) -> dict[str, Any]:
         """Try to execute the query once."""
         response_data = await self._api_wrapper(
             method="post",
             url=TIBBER_API_URL,
-            data=data,
+            data=body,
             headers=self._headers,
         )
 
@@ -300,8 +321,8 @@ class TibberPricesApiClient:
         self,
         method: str,
         url: str,
-        data: dict[str, Any] | None = None,
-        headers: dict[str, str] | None = None,
+        data: bytes | None = None,
+        headers: CIMultiDict[str] | None = None,
     ) -> Any:
         """
         Get information from the API with proper error handling.
@@ -309,7 +330,7 @@ class TibberPricesApiClient:
         Args:
             method: The HTTP method to use
             url: The URL to request
-            data: Optional data to send with the request
+            data: Optional pre-serialized JSON body to send with the request
             headers: Optional headers to include in the request
 
         Returns:
@@ -327,10 +348,14 @@ class TibberPricesApiClient:
                     method=method,
                     url=url,
                     headers=headers,
-                    json=data,
+                    data=data,
                 )
                 _verify_response_or_raise(response)
-                return await response.json()
+                return json_loads(await response.read())
+
+        except TibberPricesApiClientError:
+            # Keep authentication and rate limit errors from _verify_response_or_raise intact
+            raise
 
         except TimeoutError as exception:
             msg = f"Timeout error fetching information from Tibber API - {exception}"
@@ -340,6 +365,11 @@ class TibberPricesApiClient:
             msg = f"Error fetching information from Tibber API - {exception}"
             raise TibberPricesApiClientCommunicationError(msg) from exception
 
+        except ValueError as exception:
+            # A non-JSON body, such as a maintenance page, is a transient failure worth retrying
+            msg = f"Invalid JSON response from Tibber API - {exception}"
+            raise TibberPricesApiClientCommunicationError(msg) from exception
+
         except Exception as exception:  # pylint: disable=broad-except
             msg = f"Unexpected error while contacting Tibber API - {exception}"
             raise TibberPricesApiClientError(msg) from exception
@@ -8,7 +8,7 @@ import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry, ConfigFlow, ConfigFlowResult, OptionsFlow
 from homeassistant.const import CONF_ACCESS_TOKEN
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import callback
 from homeassistant.helpers import selector
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
@@ -22,6 +22,7 @@ from .const import (
     CONF_FETCH_MODE,
     CONF_HOME_ID,
     CONF_HOME_NAME,
+    CONF_HOMES,
     CONF_PRICE_UNIT,
     CONF_SCAN_INTERVAL,
     DEFAULT_FETCH_MODE,
@@ -34,13 +35,12 @@ from .const import (
     FETCH_MODE_CONSERVATIVE,
 )
 
+# Home fields kept in the config entry; account details and addresses are not persisted
+_PERSISTED_HOME_FIELDS = ("id", "type", "appNickname")
 
-async def validate_api_token(hass: HomeAssistant, access_token: str) -> dict[str, Any]:
+
+async def validate_api_token(client: TibberPricesApiClient) -> dict[str, Any]:
     """Validate the API token by making a request to the Tibber API."""
-    client = TibberPricesApiClient(
-        access_token=access_token,
-        session=async_get_clientsession(hass),
-    )
     return await client.async_get_user_info()
 
 
@@ -53,6 +53,8 @@ class TibberPricesConfigFlow(ConfigFlow, domain=DOMAIN):
         """Initialize the config flow."""
         self._user_data: dict[str, Any] = {}
         self._homes: list[dict[str, Any]] = []
+        self._client: TibberPricesApiClient | None = None
+        self._client_token: str | None = None
 
     async def async_step_user(self, user_input: dict[str, Any] | None = None) -> ConfigFlowResult:
         """Handle the initial step."""
@@ -60,7 +62,7 @@ class TibberPricesConfigFlow(ConfigFlow, domain=DOMAIN):
 
         if user_input is not None:
             try:
-                user_data = await validate_api_token(self.hass, user_input[CONF_ACCESS_TOKEN])
+                user_data = await validate_api_token(self._get_client(user_input[CONF_ACCESS_TOKEN]))
 
                 # Check if there are homes in the user's account
                 if "viewer" not in user_data or "homes" not in user_data["viewer"] or not user_data["viewer"]["homes"]:
@@ -77,6 +79,8 @@ class TibberPricesConfigFlow(ConfigFlow, domain=DOMAIN):
                     # For now, create the entry directly with the first home if available
                     main_entry_data = {
                         CONF_ACCESS_TOKEN: self._user_data[CONF_ACCESS_TOKEN],
+                        # Hand the validated homes to the coordinator so setup skips fetching them again
+                        CONF_HOMES: [{key: home.get(key) for key in _PERSISTED_HOME_FIELDS} for home in self._homes],
                     }
 
                     # Add the first home's ID if available
@@ -123,6 +127,16 @@ class TibberPricesConfigFlow(ConfigFlow, domain=DOMAIN):
             errors=errors,
         )
 
+    def _get_client(self, access_token: str) -> TibberPricesApiClient:
+        """Return an API client for the token, reusing it across resubmissions of the same token."""
+        if self._client is None or self._client_token != access_token:
+            self._client = TibberPricesApiClient(
+                access_token=access_token,
+                session=async_get_clientsession(self.hass),
+            )
+            self._client_token = access_token
+        return self._client
+
     @staticmethod
     @callback
     def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlow:
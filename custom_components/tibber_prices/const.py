@@ -15,8 +15,137 @@ TIBBER_API_URL = "https://api.tibber.com/v1-beta/gql"
 DEFAULT_TIMEOUT = 10
 MAX_RETRIES = 3
 RETRY_DELAY = 1.0
+MAX_RETRY_AFTER = 10.0  # Longest Retry-After (seconds) waited out before giving up
 HTTP_RATE_LIMIT_TOO_MANY_REQUESTS = 429
 
+
+def _minify_query(query: str) -> str:
+    """Collapse all whitespace runs of a GraphQL query into single spaces."""
+    return " ".join(query.split())
+
+
+# Tibber GraphQL queries (minified at import time to keep requests small)
+QUERY_USER_INFO = _minify_query(
+    """
+        {
+            viewer {
+                userId
+                name
+                login
+                homes {
+                    id
+                    type
+                    appNickname
+                    address {
+                        address1
+                        postalCode
+                        city
+                        country
+                    }
+                }
+            }
+        }
+    """
+)
+
+QUERY_PRICE_INFO = _minify_query(
+    """
+        {viewer{homes{id,currentSubscription{priceInfo{
+            range(resolution:HOURLY,last:48){edges{node{
+                startsAt total energy tax level
+            }}}
+            today{startsAt total energy tax level}
+            tomorrow{startsAt total energy tax level}
+        }}}}}
+    """
+)
+
+QUERY_ALL_PRICES = _minify_query(
+    """
+        {viewer{homes{id,currentSubscription{
+            priceInfo{
+                range(resolution:HOURLY,last:48){edges{node{
+                    startsAt total energy tax level
+                }}}
+                today{startsAt total energy tax level}
+                tomorrow{startsAt total energy tax level}
+            }
+            priceRating{
+                thresholdPercentages{low high}
+                daily{
+                    currency
+                    entries{time total energy tax difference level}
+                }
+                hourly{
+                    currency
+                    entries{time total energy tax difference level}
+                }
+                monthly{
+                    currency
+                    entries{time total energy tax difference level}
+                }
+            }
+        }}}}
+    """
+)
+
+QUERY_PRICES_HOURLY_RATING = _minify_query(
+    """
+        {viewer{homes{id,currentSubscription{
+            priceInfo{
+                range(resolution:HOURLY,last:48){edges{node{
+                    startsAt total energy tax level
+                }}}
+                today{startsAt total energy tax level}
+                tomorrow{startsAt total energy tax level}
+            }
+            priceRating{
+                thresholdPercentages{low high}
+                hourly{
+                    currency
+                    entries{time total energy tax difference level}
+                }
+            }
+        }}}}
+    """
+)
+
+QUERY_DAILY_PRICE_RATING = _minify_query(
+    """
+        {viewer{homes{id,currentSubscription{priceRating{
+            thresholdPercentages{low high}
+            daily{
+                currency
+                entries{time total energy tax difference level}
+            }
+        }}}}}
+    """
+)
+
+QUERY_HOURLY_PRICE_RATING = _minify_query(
+    """
+        {viewer{homes{id,currentSubscription{priceRating{
+            thresholdPercentages{low high}
+            hourly{
+                currency
+                entries{time total energy tax difference level}
+            }
+        }}}}}
+    """
+)
+
+QUERY_MONTHLY_PRICE_RATING = _minify_query(
+    """
+        {viewer{homes{id,currentSubscription{priceRating{
+            thresholdPercentages{low high}
+            monthly{
+                currency
+                entries{time total energy tax difference level}
+            }
+        }}}}}
+    """
+)
+
 # Configuration constants
 CONF_HOME_ID = "home_id"
 CONF_HOME_NAME = "home_name"
@@ -25,6 +154,7 @@ CONF_PRICE_UNIT = "price_unit"
 CONF_FETCH_MODE = "fetch_mode"
 CONF_PARENT_ENTRY_ID = "parent_entry_id"
 CONF_SUB_ENTRY = "sub_entry"
+CONF_HOMES = "homes"
 
 # Default values
 DEFAULT_SCAN_INTERVAL = 60  # 1 hour in minutes
@@ -3,13 +3,18 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import logging
 import secrets
-from datetime import datetime, time, timedelta
+from datetime import date, datetime, time, timedelta
 from enum import Enum
+from time import monotonic
 from typing import TYPE_CHECKING, Any, Final
 
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.event import async_track_point_in_time
 from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as dt_util
@@ -20,7 +25,7 @@ from .api import (
     TibberPricesApiClientError,
     TibberPricesApiClientRateLimitError,
 )
-from .const import DOMAIN, LOGGER
+from .const import CONF_HOMES, DOMAIN, LOGGER
 from .helpers import (
     check_for_missed_midnight_transition,
     check_for_missing_current_hour,
@@ -52,11 +57,30 @@ ENTITY_UPDATE_MINUTES: Final = [0, 15, 30, 45]  # Standard quarter-hour alignmen
 WAITING_CHECK_INTERVAL: Final = timedelta(minutes=15)  # 15-min distributed checks
 SEARCHING_CHECK_INTERVAL: Final = timedelta(minutes=5)  # Frequent checks when searching
 
-# Minutes offset for distributed API calls during WAITING state
-API_MINUTE_OFFSETS: Final = [0, 1, 2, 3, 4]
+# Upper bound (exclusive) of the per-installation delay added to scheduled updates
+API_JITTER_SECONDS: Final = 45
 
-# Hours in a day constant to avoid magic number
-HOURS_IN_DAY: Final = 24
+# Refresh requests arriving within this many seconds of each other are merged into one update cycle
+REFRESH_COOLDOWN: Final = 2.0
+
+# Price rating periods, all of them and the one fetched on every update cycle
+RATING_PERIODS: Final[tuple[str, ...]] = ("hourly", "daily", "monthly")
+HOURLY_RATING_PERIODS: Final[tuple[str, ...]] = ("hourly",)
+
+# Minimum lead time when scheduling the next entity update
+MIN_SCHEDULE_DELAY: Final = timedelta(seconds=0.5)
+
+# How long a determined API state is reused before it is evaluated again
+API_STATE_CACHE_SECONDS: Final = 1.0
+
+# Persistent cache storage version and the delay used to merge consecutive saves into one write
+STORAGE_VERSION: Final = 1
+STORAGE_SAVE_DELAY: Final = 10
+
+
+def _index_homes(homes: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    """Index homes by ID, sharing the home dicts with the given list."""
+    return {home["id"]: home for home in homes}
 
 
 # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
@@ -67,7 +91,11 @@ class TibberPricesDataUpdateCoordinator(DataUpdateCoordinator):
     _last_full_update: datetime | None = None
     _last_tomorrow_check: datetime | None = None
     _tomorrow_data_available: bool = False
-    _scheduled_update_task: asyncio.Task | None = None
+    _unsub_scheduled_update: CALLBACK_TYPE | None = None
+    _last_scheduled_tick: datetime | None = None
+    _last_daily_rating_date: date | None = None
+    _last_summary_sig: tuple[Any, ...] | None = None
+    _store: Store[dict[str, Any]]
 
     def __init__(
         self,
@@ -84,22 +112,38 @@ class TibberPricesDataUpdateCoordinator(DataUpdateCoordinator):
             hass=hass,
             logger=LOGGER,
             name="tibber_prices",
+            request_refresh_debouncer=Debouncer(hass, LOGGER, cooldown=REFRESH_COOLDOWN, immediate=True),
             **kwargs,
         )
         self.client = client
         self.home_id = home_id
         self._data_cache: dict[str, Any] = {}
         self._initialized: bool = False
+        # Serializes update cycles and midnight rotation so they never overlap
+        self._refresh_lock = asyncio.Lock()
+        # Memoized API state with the monotonic time it was determined, and the today-data check result
+        self._state_cache: tuple[float, ApiState] | None = None
+        self._today_data_missing: bool | None = None
+        # Parsed start dates of each home's tomorrow prices, keyed by home ID together with the parsed list
+        self._tomorrow_dates: dict[str, tuple[list[dict[str, Any]], frozenset[date]]] = {}
 
         # Generate a stable offset for this installation to distribute API calls
         if home_id:
-            # Use hash of home_id for stable distribution
-            self._offset_index = abs(hash(home_id)) % len(API_MINUTE_OFFSETS)
+            # Use a digest of home_id for distribution that stays stable across restarts,
+            # unlike hash() which is salted per process
+            digest = hashlib.blake2b(home_id.encode("utf-8"), digest_size=4).digest()
+            self._offset_index = int.from_bytes(digest[:2], "little") % len(ENTITY_UPDATE_MINUTES)
+            self._jitter_seconds = int.from_bytes(digest[2:], "little") % API_JITTER_SECONDS
         else:
             # Fallback to random offset if no home_id
-            self._offset_index = secrets.randbelow(len(API_MINUTE_OFFSETS))
+            self._offset_index = secrets.randbelow(len(ENTITY_UPDATE_MINUTES))
+            self._jitter_seconds = secrets.randbelow(API_JITTER_SECONDS)
 
-        self.logger.debug("Using minute offset index %s for API distribution", self._offset_index)
+        self.logger.debug(
+            "Using minute offset index %s and %s seconds jitter for API distribution",
+            self._offset_index,
+            self._jitter_seconds,
+        )
 
     async def async_initialize(self) -> None:
         """
@@ -112,6 +156,7 @@ class TibberPricesDataUpdateCoordinator(DataUpdateCoordinator):
         self.logger.info("====== INITIALIZING TIBBER PRICES COORDINATOR ======")
 
         # Load data from persistent storage
+        self._store = Store(self.hass, STORAGE_VERSION, f"{DOMAIN}_{self.config_entry.entry_id}")
         await self._load_cached_data()
 
         # Mark as initialized - ready to handle refresh calls
@@ -135,6 +180,20 @@ class TibberPricesDataUpdateCoordinator(DataUpdateCoordinator):
 
     @property
     def current_api_state(self) -> ApiState:
+        """Return the current API state, reusing the result determined within the last second."""
+        if self._state_cache is not None and monotonic() - self._state_cache[0] < API_STATE_CACHE_SECONDS:
+            return self._state_cache[1]
+
+        state = self._determine_api_state()
+        self._state_cache = (monotonic(), state)
+        return state
+
+    def _invalidate_api_state(self) -> None:
+        """Drop the memoized API state and today-data check after the cached data changed."""
+        self._state_cache = None
+        self._today_data_missing = None
+
+    def _determine_api_state(self) -> ApiState:
         """Determine the current API state based on data availability and time of day."""
         # First, check if we have all the data we need
         # If we already have tomorrow's data, we're in IDLE state regardless of time
@@ -161,12 +220,14 @@ class TibberPricesDataUpdateCoordinator(DataUpdateCoordinator):
     async def _load_cached_data(self) -> None:
         """Load data from persistent storage."""
         self.logger.info("INITIALIZATION PHASE: Loading cached data")
-        store = Store(self.hass, 1, f"{DOMAIN}_{self.config_entry.entry_id}")
-        stored_data = await store.async_load()
+        stored_data = await self._store.async_load()
 
         if stored_data:
             self.logger.info("Cache found: Restoring data from persistent storage")
             self._data_cache = stored_data.get("data", {})
+            # The homes index is not persisted, rebuild it so it shares the home dicts with the user info
+            if homes := (self._data_cache.get("user_info") or {}).get("homes"):
+                self._data_cache["homes"] = _index_homes(homes)
 
             # Check if we have tomorrow's data available
             if "price_info" in self._data_cache:
@@ -189,10 +250,33 @@ class TibberPricesDataUpdateCoordinator(DataUpdateCoordinator):
         else:
             self.logger.info("First run: No cached data found - will perform full initialization")
 
-    async def _save_cached_data(self) -> None:
-        """Save data to persistent storage."""
-        store = Store(self.hass, 1, f"{DOMAIN}_{self.config_entry.entry_id}")
-        await store.async_save({"data": self._data_cache})
+        # Seed the homes validated during config flow so the first refresh does not fetch user info again
+        if not self._data_cache.get("user_info"):
+            homes = self.config_entry.data.get(CONF_HOMES)
+            if homes:
+                self.logger.debug("Using homes from config entry, skipping initial user info fetch")
+                self._data_cache["user_info"] = {"homes": homes}
+                self._data_cache["homes"] = _index_homes(homes)
+
+        self._invalidate_api_state()
+
+    def _data_snapshot(self) -> dict[str, Any]:
+        """Return the data to persist, read when the delayed save is written."""
+        # The homes index duplicates the homes in the user info and is rebuilt when loading
+        return {"data": {key: value for key, value in self._data_cache.items() if key != "homes"}}
+
+    async def async_flush_cache(self) -> None:
+        """Write the cached data to persistent storage now, replacing any pending delayed save."""
+        if self._initialized and self._data_cache:
+            await self._store.async_save(self._data_snapshot())
+
+    def _save_cached_data(self) -> None:
+        """Schedule saving the cached data to persistent storage, merging saves that follow each other closely."""
+        self._store.async_delay_save(self._data_snapshot, STORAGE_SAVE_DELAY)
+
+        # The statistics below are only needed for the log line
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
 
         homes_count = len(self._data_cache.get("homes", {}))
         price_info_count = len(self._data_cache.get("price_info", {}))
@@ -204,7 +288,7 @@ class TibberPricesDataUpdateCoordinator(DataUpdateCoordinator):
         )
 
         self.logger.info(
-            "CACHE UPDATE: Saved %d homes, %d price records (%d today prices, %d tomorrow prices)",
+            "CACHE UPDATE: Scheduled saving %d homes, %d price records (%d today prices, %d tomorrow prices)",
             homes_count,
             price_info_count,
             today_prices_count,
@@ -232,7 +316,7 @@ class TibberPricesDataUpdateCoordinator(DataUpdateCoordinator):
 
         # Only need to explicitly save if we got data
         if self.data and self.data != {}:
-            await self._save_cached_data()
+            self._save_cached_data()
 
         # Log completion info
         if is_first_refresh:
@@ -242,29 +326,30 @@ class TibberPricesDataUpdateCoordinator(DataUpdateCoordinator):
 
     def _is_missing_today_data(self) -> bool:
         """Check if today's price data is missing."""
-        return any(not price_info.get("today") for price_info in self._data_cache.get("price_info", {}).values())
+        if self._today_data_missing is None:
+            homes_price_info = self._data_cache.get("price_info")
+            if not homes_price_info:
+                self._today_data_missing = True
+            else:
+                self._today_data_missing = any(not price_info.get("today") for price_info in homes_price_info.values())
+        return self._today_data_missing
 
-    def _should_check_in_waiting_state(self) -> bool:
+    def _should_check_in_waiting_state(self, now: datetime) -> bool:
         """Determine if we should check for data in WAITING state (13:00-15:00)."""
-        now = dt_util.now()
-
         # Skip if we checked recently
         if self._last_tomorrow_check and (now - self._last_tomorrow_check) < WAITING_CHECK_INTERVAL:
             return False
 
-        # Only check at specific distributed minutes
-        target_minute = ENTITY_UPDATE_MINUTES[self._offset_index % len(ENTITY_UPDATE_MINUTES)]
-        minute_offset = API_MINUTE_OFFSETS[self._offset_index % len(API_MINUTE_OFFSETS)]
-        return now.minute == (target_minute + minute_offset) % 60
+        # Only check on this installation's quarter-hour tick; the jitter seconds spread installations within it
+        target_minute = ENTITY_UPDATE_MINUTES[self._offset_index]
+        return now.minute == target_minute and now.second >= self._jitter_seconds
 
-    def _should_check_in_searching_state(self) -> bool:
+    def _should_check_in_searching_state(self, now: datetime) -> bool:
         """Determine if we should check for data in SEARCHING state (15:00-00:00)."""
-        now = dt_util.now()
-
         # Check frequently until we get tomorrow's data
         return not self._last_tomorrow_check or (now - self._last_tomorrow_check) >= SEARCHING_CHECK_INTERVAL
 
-    def _should_fetch_data(self) -> bool:
+    def _should_fetch_data(self, now: datetime) -> bool:
         """Determine whether we should fetch data from the API based on current state."""
         # Skip fetch if we haven't completed initialization
         if not self._initialized:
@@ -291,37 +376,47 @@ class TibberPricesDataUpdateCoordinator(DataUpdateCoordinator):
 
         # In WAITING state, check periodically based on distribution
         if state == ApiState.WAITING:
-            fetch_decision = self._should_check_in_waiting_state()
+            fetch_decision = self._should_check_in_waiting_state(now)
             if fetch_decision:
                 self.logger.debug("Fetching data: Scheduled distributed check for tomorrow's data")
             return fetch_decision
 
         # In SEARCHING state, check more frequently
-        fetch_decision = self._should_check_in_searching_state()
+        fetch_decision = self._should_check_in_searching_state(now)
         if fetch_decision:
             self.logger.debug("Fetching data: Actively searching for tomorrow's data")
         return fetch_decision
 
     async def _async_update_data(self) -> dict[str, Any]:
-        """Update data via library with time-aware strategy."""
+        """Update data via library with time-aware strategy, running one update cycle at a time."""
+        async with self._refresh_lock:
+            return await self._async_run_update_cycle()
+
+    async def _async_run_update_cycle(self) -> dict[str, Any]:
+        """Run a single update cycle, fetching from the API only when the current state requires it."""
         now = dt_util.now()
-        data = self._data_cache.copy()
+        self._invalidate_api_state()
+        # Working set for this cycle; per-home entries are replaced, never mutated, so the cache stays
+        # untouched until the cycle completes
+        data: dict[str, Any] = {
+            "user_info": self._data_cache.get("user_info"),
+            "homes": self._data_cache.get("homes"),
+            "price_info": dict(self._data_cache.get("price_info", {})),
+            "price_rating": dict(self._data_cache.get("price_rating", {})),
+        }
 
         # For tracking API calls and timing
         start_time = now
 
         try:
-            # Get client from hass.data
-            client = self._get_api_client()
-            if not client:
-                self.logger.error("API client not available")
-                return self._data_cache
+            # The client is handed in on construction and lives as long as the config entry
+            client = self.client
 
             # Log current state and cache status
-            self._log_update_status()
+            self._log_update_status(now)
 
             # Check if we should fetch new data
-            if not self._should_fetch_data():
+            if not self._should_fetch_data(now):
                 self.logger.debug("Using cached data - no API call needed, just entity recalculation")
                 self._schedule_next_entity_update()
                 return self._data_cache
@@ -340,26 +435,29 @@ class TibberPricesDataUpdateCoordinator(DataUpdateCoordinator):
                 ),
             )
 
-            # Fetch basic data if needed
-            await self._fetch_basic_data(client, data)
-
-            # Get price info
-            state = self.current_api_state
-            self.logger.debug("Fetching price info from API (state: %s)", state.value)
-            price_info = await client.async_get_price_info()
-            self._process_price_info(price_info, data)
+            # Fetch basic data (if needed) concurrently with price info and price ratings
+            results = await asyncio.gather(
+                self._fetch_basic_data(client, data),
+                self._fetch_all_prices(client, state, data),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+            daily_rating_date = results[1]
             self._last_full_update = now
 
-            # Get price ratings
-            await self._fetch_price_ratings(client, state, data)
-
             # Check for tomorrow's data
             if state in (ApiState.WAITING, ApiState.SEARCHING):
-                await self._check_tomorrow_data(client, state, data)
+                self._check_tomorrow_data(state, data)
 
             # Update cache and save
             self._data_cache = data
-            await self._save_cached_data()
+            # Only recorded once the fetched ratings are part of the cache
+            if daily_rating_date is not None:
+                self._last_daily_rating_date = daily_rating_date
+            self._invalidate_api_state()
+            self._save_cached_data()
 
             # Log state transition and data summary
             self._log_state_transition(state)
@@ -377,44 +475,59 @@ class TibberPricesDataUpdateCoordinator(DataUpdateCoordinator):
             raise ConfigEntryAuthFailed(exception) from exception
         except TibberPricesApiClientRateLimitError as exception:
             self.logger.warning("Rate limit exceeded, using cached data: %s", exception)
+            self._schedule_next_entity_update()
             return self._data_cache
         except TibberPricesApiClientError as exception:
+            # Keep the schedule running so the next tick can retry
+            self._schedule_next_entity_update()
             raise UpdateFailed(exception) from exception
         else:
             return data
 
-    async def _fetch_price_ratings(self, client: TibberPricesApiClient, state: ApiState, data: dict[str, Any]) -> None:
-        """Fetch price ratings based on the current state."""
-        # Track API calls for more detailed logging
-        api_calls = 0
+    async def _fetch_all_prices(
+        self, client: TibberPricesApiClient, state: ApiState, data: dict[str, Any]
+    ) -> date | None:
+        """
+        Fetch price info together with the price ratings that are due for this cycle.
+
+        Returns:
+            The date the daily and monthly ratings were fetched for, or None if only hourly ratings were fetched
+
+        """
         start_time = dt_util.now()
 
-        # Daily ratings - fetch always
-        self.logger.debug("Fetching daily price ratings from API")
-        daily_ratings = await client.async_get_daily_price_rating()
-        self._process_price_rating(daily_ratings, "daily", data)
-        api_calls += 1
-
-        # Hourly ratings - fetch during active states, or if not in cache
-        if state != ApiState.IDLE or "hourly" not in data.get("price_rating", {}):
-            self.logger.debug("Fetching hourly price ratings from API")
-            hourly_ratings = await client.async_get_hourly_price_rating()
-            self._process_price_rating(hourly_ratings, "hourly", data)
-            api_calls += 1
-
-        # Monthly ratings - fetch only in IDLE state to minimize API calls, or if not in cache
-        if state == ApiState.IDLE or "monthly" not in data.get("price_rating", {}):
-            self.logger.debug("Fetching monthly price ratings from API")
-            monthly_ratings = await client.async_get_monthly_price_rating()
-            self._process_price_rating(monthly_ratings, "monthly", data)
-            api_calls += 1
+        # Daily and monthly ratings only change with the date, so they are fetched once per day
+        today = start_time.date()
+        homes_price_rating = data.get("price_rating", {})
+        needs_daily_ratings = (
+            self._last_daily_rating_date != today
+            or not homes_price_rating
+            or any("daily" not in rating or "monthly" not in rating for rating in homes_price_rating.values())
+        )
+
+        self.logger.debug(
+            "Fetching price info and %s price ratings from API (state: %s)",
+            "all" if needs_daily_ratings else "hourly",
+            state.value,
+        )
+        if needs_daily_ratings:
+            all_prices = await client.async_get_all_prices()
+            period_types = RATING_PERIODS
+        else:
+            all_prices = await client.async_get_prices_with_hourly_rating()
+            period_types = HOURLY_RATING_PERIODS
+
+        self._merge_home_data(data.setdefault("price_info", {}), self._process_price_info(all_prices))
+        self._merge_home_data(data.setdefault("price_rating", {}), self._process_price_rating(all_prices, period_types))
 
         # Log timing information
         duration = (dt_util.now() - start_time).total_seconds()
-        self.logger.debug("Price ratings fetch complete: %d API calls in %.3f seconds", api_calls, duration)
+        self.logger.debug("Price info and ratings fetch complete in %.3f seconds", duration)
 
-    async def _check_tomorrow_data(self, client: TibberPricesApiClient, state: ApiState, data: dict[str, Any]) -> None:
-        """Check if tomorrow's data is available and update if needed."""
+        return today if needs_daily_ratings else None
+
+    def _check_tomorrow_data(self, state: ApiState, data: dict[str, Any]) -> None:
+        """Check if tomorrow's data is available in the price info fetched during this update cycle."""
         now = dt_util.now()
         start_time = now
         tomorrow = (now + timedelta(days=1)).date()
@@ -430,34 +543,19 @@ class TibberPricesDataUpdateCoordinator(DataUpdateCoordinator):
 
         old_tomorrow_data_status = self._tomorrow_data_available
 
-        # Check if we have tomorrow's data for each home
-        self._tomorrow_data_available = True
-        homes_with_tomorrow = 0
-        total_homes = len(data.get("price_info", {}))
+        homes_price_info = data.get("price_info", {})
 
-        for price_info in data.get("price_info", {}).values():
-            if not price_info.get("tomorrow"):
-                self._tomorrow_data_available = False
-                continue
-
-            # Check if the data is actually for tomorrow
-            has_tomorrow_data = False
-            for price in price_info.get("tomorrow", []):
-                # Parse the datetime string before attempting to access date()
-                starts_at = dt_util.parse_datetime(price["startsAt"])
-                if starts_at and starts_at.date() == tomorrow:
-                    has_tomorrow_data = True
-                    homes_with_tomorrow += 1
-                    break
-
-            if not has_tomorrow_data:
-                self._tomorrow_data_available = False
+        # Check if we have tomorrow's data for each home, stopping at the first home without it
+        self._tomorrow_data_available = all(
+            self._has_tomorrow_data(home_id, price_info, tomorrow) for home_id, price_info in homes_price_info.items()
+        )
 
         self._last_tomorrow_check = now
         duration = (now - start_time).total_seconds()
 
         # Log the result of the tomorrow data check
-        if self._tomorrow_data_available != old_tomorrow_data_status:
+        if self._tomorrow_data_available != old_tomorrow_data_status and self.logger.isEnabledFor(logging.INFO):
+            total_homes = len(homes_price_info)
             if self._tomorrow_data_available:
                 self.logger.info(
                     "TOMORROW DATA CHECK: Found complete price data for %s (all %d homes) in %.3f seconds",
@@ -466,6 +564,11 @@ class TibberPricesDataUpdateCoordinator(DataUpdateCoordinator):
                     duration,
                 )
             else:
+                homes_with_tomorrow = sum(
+                    1
+                    for home_id, price_info in homes_price_info.items()
+                    if self._has_tomorrow_data(home_id, price_info, tomorrow)
+                )
                 self.logger.info(
                     "TOMORROW DATA CHECK: Still waiting for complete price data for %s"
                     " (%d/%d homes have data) - check took %.3f seconds",
@@ -475,117 +578,129 @@ class TibberPricesDataUpdateCoordinator(DataUpdateCoordinator):
                     duration,
                 )
 
-        # If we're in SEARCHING state and don't have tomorrow's data, try to fetch it
-        if state == ApiState.SEARCHING and not self._tomorrow_data_available:
-            self.logger.debug("Actively searching for tomorrow's data in SEARCHING state")
-            price_info = await client.async_get_price_info()
-            self._process_price_info(price_info, data)
+    def _has_tomorrow_data(self, home_id: str, price_info: dict[str, Any], tomorrow: date) -> bool:
+        """Check if a home has prices that actually start tomorrow."""
+        tomorrow_prices = price_info.get("tomorrow")
+        return bool(tomorrow_prices) and tomorrow in self._get_tomorrow_dates(home_id, tomorrow_prices)
+
+    def _get_tomorrow_dates(self, home_id: str, tomorrow_prices: list[dict[str, Any]]) -> frozenset[date]:
+        """Return the start dates of a home's tomorrow prices, parsing them only once per price list."""
+        cached = self._tomorrow_dates.get(home_id)
+        if cached is not None and cached[0] is tomorrow_prices:
+            return cached[1]
+
+        dates = frozenset(
+            starts_at.date()
+            for price in tomorrow_prices
+            if (starts_at := dt_util.parse_datetime(price["startsAt"])) is not None
+        )
+        self._tomorrow_dates[home_id] = (tomorrow_prices, dates)
+        return dates
 
-    def _process_price_info(self, price_info: dict[str, Any], data: dict[str, Any]) -> None:
-        """Process and store price information in the data dictionary."""
+    @staticmethod
+    def _process_price_info(price_info: dict[str, Any]) -> dict[str, dict[str, Any]]:
+        """Extract the price information of each home in an API response, keyed by home ID."""
         if "viewer" not in price_info or "homes" not in price_info["viewer"]:
-            return
-
-        if "price_info" not in data:
-            data["price_info"] = {}
+            return {}
 
+        homes_price_info: dict[str, dict[str, Any]] = {}
         for home in price_info["viewer"]["homes"]:
-            home_id = home["id"]
-            subscription = home.get("currentSubscription", {})
-            price_info_data = subscription.get("priceInfo", {})
+            try:
+                price_info_data = home["currentSubscription"]["priceInfo"]
+            except (KeyError, TypeError):
+                # Home without (active) subscription or price info
+                continue
+            if not price_info_data:
+                continue
 
-            if home_id not in data["price_info"]:
-                data["price_info"][home_id] = {}
+            home_price_info: dict[str, Any] = {}
 
             # Process range prices
-            if "range" in price_info_data and "edges" in price_info_data["range"]:
-                data["price_info"][home_id]["range_prices"] = []
-                for edge in price_info_data["range"]["edges"]:
-                    if "node" in edge:
-                        data["price_info"][home_id]["range_prices"].append(edge["node"])
+            if (price_range := price_info_data.get("range")) and "edges" in price_range:
+                home_price_info["range_prices"] = [edge["node"] for edge in price_range["edges"] if "node" in edge]
 
             # Process today's prices
             if "today" in price_info_data:
-                data["price_info"][home_id]["today"] = price_info_data["today"]
+                home_price_info["today"] = price_info_data["today"]
 
             # Process tomorrow's prices
             if "tomorrow" in price_info_data:
-                data["price_info"][home_id]["tomorrow"] = price_info_data["tomorrow"]
+                home_price_info["tomorrow"] = price_info_data["tomorrow"]
 
-    def _process_price_rating(self, price_rating: dict[str, Any], period_type: str, data: dict[str, Any]) -> None:
-        """Process and store price rating information in the data dictionary."""
-        if "viewer" not in price_rating or "homes" not in price_rating["viewer"]:
-            return
+            homes_price_info[home["id"]] = home_price_info
 
-        if "price_rating" not in data:
-            data["price_rating"] = {}
+        return homes_price_info
 
+    @staticmethod
+    def _process_price_rating(price_rating: dict[str, Any], period_types: tuple[str, ...]) -> dict[str, dict[str, Any]]:
+        """Extract the price rating of each home for the given periods in an API response, keyed by home ID."""
+        if "viewer" not in price_rating or "homes" not in price_rating["viewer"]:
+            return {}
+
+        homes_price_rating: dict[str, dict[str, Any]] = {}
         for home in price_rating["viewer"]["homes"]:
-            home_id = home["id"]
-            subscription = home.get("currentSubscription", {})
-            rating_data = subscription.get("priceRating", {})
+            try:
+                rating_data = home["currentSubscription"]["priceRating"]
+            except (KeyError, TypeError):
+                # Home without (active) subscription or price rating
+                continue
+            if not rating_data:
+                continue
 
-            if home_id not in data["price_rating"]:
-                data["price_rating"][home_id] = {}
+            home_price_rating: dict[str, Any] = {}
 
             # Store threshold percentages
             if "thresholdPercentages" in rating_data:
-                data["price_rating"][home_id]["thresholds"] = rating_data["thresholdPercentages"]
+                home_price_rating["thresholds"] = rating_data["thresholdPercentages"]
 
             # Store period data (hourly, daily, monthly)
-            if period_type in rating_data:
-                data["price_rating"][home_id][period_type] = rating_data[period_type]
+            for period_type in period_types:
+                if period_type in rating_data:
+                    home_price_rating[period_type] = rating_data[period_type]
+
+            homes_price_rating[home["id"]] = home_price_rating
+
+        return homes_price_rating
+
+    @staticmethod
+    def _merge_home_data(homes_data: dict[str, dict[str, Any]], updates: dict[str, dict[str, Any]]) -> None:
+        """Merge per-home updates into new per-home dicts, keeping fields the updates don't contain."""
+        for home_id, home_update in updates.items():
+            homes_data[home_id] = {**homes_data.get(home_id, {}), **home_update}
 
     def _get_next_entity_update_time(self, now: datetime) -> datetime:
-        """Get next entity update time aligned to quarter-hour intervals."""
-        minutes_now = now.minute
-
-        # Find the next standard minute
-        next_minute = None
-        for std_minute in ENTITY_UPDATE_MINUTES:
-            if std_minute > minutes_now:
-                next_minute = std_minute
-                break
-
-        if next_minute is None:
-            # If we're past all standard minutes, go to next hour
-            next_minute = ENTITY_UPDATE_MINUTES[0]
-            next_hour = now.hour + 1
-        else:
-            next_hour = now.hour
-
-        # Create target time
-        return self._create_update_time(now, next_hour, next_minute)
-
-    def _create_update_time(self, now: datetime, hour: int, minute: int) -> datetime:
-        """Create update time with proper handling of day rollover."""
-        next_update = now.replace(
-            hour=hour % HOURS_IN_DAY,
-            minute=minute,
-            second=0,
-            microsecond=0,
+        """Get next entity update time aligned to quarter-hour intervals plus this installation's jitter."""
+        interval_minutes = int(ENTITY_UPDATE_INTERVAL.total_seconds()) // 60
+        # Adding a timedelta handles hour and day rollover
+        next_update = now.replace(second=0, microsecond=0) + timedelta(
+            minutes=interval_minutes - now.minute % interval_minutes
         )
 
-        # If we rolled over to next day, adjust the date
-        if hour >= HOURS_IN_DAY:
-            next_update = next_update + timedelta(days=1)
-
-        return next_update
+        # Delay by the jitter to spread requests of different installations
+        return next_update + timedelta(seconds=self._jitter_seconds)
 
     @callback
     def _schedule_next_entity_update(self) -> None:
         """Schedule the next entity update aligned to quarter-hour intervals."""
-        if self._scheduled_update_task:
-            self._scheduled_update_task.cancel()
+        if self._unsub_scheduled_update is not None:
+            self._unsub_scheduled_update()
 
-        now = dt_util.now()
-        next_update = self._get_next_entity_update_time(now)
+        now = dt_util.now().replace(microsecond=0)
+        # Continue from the tick that triggered this refresh so a slow refresh doesn't push later ticks back,
+        # but never schedule into the past
+        reference = self._last_scheduled_tick or now
+        self._last_scheduled_tick = None
+        next_update = max(self._get_next_entity_update_time(reference), now + MIN_SCHEDULE_DELAY)
+
+        # Schedule the update
+        self._unsub_scheduled_update = async_track_point_in_time(self.hass, self._handle_scheduled_update, next_update)
 
-        # Calculate seconds until next update
-        delay = (next_update - now).total_seconds()
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self._log_next_entity_update(now, next_update)
 
-        # Clarify in the log whether this is for API fetching or just entity recalculation
-        will_fetch = self._should_fetch_data()
+    def _log_next_entity_update(self, now: datetime, next_update: datetime) -> None:
+        """Log the scheduled update, clarifying whether it is for API fetching or just entity recalculation."""
+        will_fetch = self._should_fetch_data(now)
         api_state = self.current_api_state
 
         # More descriptive log message
@@ -606,39 +721,39 @@ class TibberPricesDataUpdateCoordinator(DataUpdateCoordinator):
             data_status,
         )
 
-        # Schedule the update
-        self._scheduled_update_task = asyncio.create_task(self._handle_scheduled_update(delay))
-
-    async def _handle_scheduled_update(self, delay: float) -> None:
-        """Handle the scheduled update after the specified delay."""
-        await asyncio.sleep(delay)
-        # This will call async_refresh() which then calls the parent's implementation
-        # which will in turn call our _async_update_data()
-        await self.async_refresh()
+    @callback
+    def _handle_scheduled_update(self, now: datetime) -> None:
+        """Handle the scheduled update at the aligned point in time."""
+        self._unsub_scheduled_update = None
+        self._last_scheduled_tick = now
+        # Goes through the debouncer, which calls async_refresh() and in turn our _async_update_data()
+        self.hass.async_create_task(self.async_request_refresh())
 
     def cancel_scheduled_updates(self) -> None:
         """Cancel any scheduled update tasks."""
-        if self._scheduled_update_task is not None:
-            self._scheduled_update_task.cancel()
-            self._scheduled_update_task = None
+        if self._unsub_scheduled_update is not None:
+            self._unsub_scheduled_update()
+            self._unsub_scheduled_update = None
 
     @callback
     def async_handle_midnight_transition(self) -> None:
         """Handle data rotation at midnight."""
         # This is called from __init__.py at midnight
         self.logger.info("====== MIDNIGHT TRANSITION DETECTED ======")
+        self.hass.async_create_task(self._async_rotate_and_refresh())
 
-        # Perform the midnight rotation using shared implementation
-        self._perform_midnight_rotation()
+    async def _async_rotate_and_refresh(self) -> None:
+        """Rotate the cached data once no update cycle is running, then refresh."""
+        async with self._refresh_lock:
+            # Perform the midnight rotation using shared implementation
+            self._perform_midnight_rotation()
 
-        # Save the updated data to persistent storage
-        save_task = asyncio.create_task(self._save_cached_data())
-        save_task.add_done_callback(lambda _: None)
+            # Save the updated data to persistent storage
+            self._save_cached_data()
 
         # Force a refresh to get updated data
         self.logger.info("Scheduling refresh to fetch new tomorrow's data")
-        refresh_task = asyncio.create_task(self.async_refresh())
-        refresh_task.add_done_callback(lambda _: None)
+        await self.async_request_refresh()
 
     async def _check_and_handle_missed_midnight_transition(self) -> None:
         """
@@ -675,9 +790,10 @@ class TibberPricesDataUpdateCoordinator(DataUpdateCoordinator):
 
             # Reset tomorrow data availability flag
             self._tomorrow_data_available = False
+            self._invalidate_api_state()
 
             # Save rotated data to storage
-            await self._save_cached_data()
+            self._save_cached_data()
             self.logger.info("Completed missed midnight data rotation during initialization")
 
             # Force an immediate refresh if data is severely outdated
@@ -687,8 +803,7 @@ class TibberPricesDataUpdateCoordinator(DataUpdateCoordinator):
                     midnight_check["avg_days_old"],
                 )
                 # Schedule immediate refresh task
-                refresh_task = asyncio.create_task(self.async_refresh())
-                refresh_task.add_done_callback(lambda _: None)
+                self.hass.async_create_task(self.async_request_refresh())
         else:
             # Run validations on the cache
             await self._validate_cache_data()
@@ -703,14 +818,22 @@ class TibberPricesDataUpdateCoordinator(DataUpdateCoordinator):
             )
             if structure_result["needs_full_refresh"]:
                 self.logger.info("Scheduling immediate refresh to fix structural issues")
-                refresh_task = asyncio.create_task(self.async_refresh())
-                refresh_task.add_done_callback(lambda _: None)
+                self.hass.async_create_task(self.async_request_refresh())
                 return
 
         # Then check for missing current hour data
-        await check_for_missing_current_hour(self.logger, self._data_cache, self.async_refresh, self._last_full_update)
+        await check_for_missing_current_hour(
+            self.logger, self._data_cache, self._schedule_validation_refresh, self._last_full_update
+        )
         self.logger.debug("Completed cache data validation")
 
+    @callback
+    def _schedule_validation_refresh(self) -> None:
+        """Request a refresh in a background task that is cancelled if the config entry unloads first."""
+        self.config_entry.async_create_background_task(
+            self.hass, self.async_request_refresh(), "tibber_prices cache validation refresh"
+        )
+
     def _perform_midnight_rotation(self) -> None:
         """
         Perform the midnight data rotation (move tomorrow to today).
@@ -723,71 +846,76 @@ class TibberPricesDataUpdateCoordinator(DataUpdateCoordinator):
 
         # Reset tomorrow data availability flag
         self._tomorrow_data_available = False
+        self._invalidate_api_state()
 
-    def _get_api_client(self) -> TibberPricesApiClient | None:
-        """Get the API client from hass.data."""
-        if DOMAIN in self.hass.data and self.config_entry.entry_id in self.hass.data[DOMAIN]:
-            runtime_data = self.hass.data[DOMAIN][self.config_entry.entry_id]
-            return runtime_data.client
-        return None
-
-    def _log_update_status(self) -> None:
+    def _log_update_status(self, now: datetime) -> None:
         """Log current state and cache status."""
+        # INFO is enabled whenever DEBUG is, so nothing is logged below INFO
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self._log_detailed_status(now)
+
+        # Check if basic data exists - log at INFO level for missing data
+        if not self._data_cache.get("user_info") or not self._data_cache.get("homes"):
+            self.logger.info("CACHE STATUS: Missing basic user data, initialization needed")
+        elif self._is_missing_today_data():
+            self.logger.info("CACHE STATUS: Missing today's price data, fetch required")
+        else:
+            self.logger.debug("CACHE STATUS: Basic data and today's prices available")
+
+    def _log_detailed_status(self, now: datetime) -> None:
+        """Log the API state with time window and tomorrow data details at debug level."""
         state = self.current_api_state
-        now = dt_util.now()
 
         # Create a more informative status message based on time and data
         time_window = "before 13:00"
         if now.time() >= TOMORROW_DATA_CHECK_START:
             time_window = "13:00-15:00" if now.time() < INTENSIVE_SEARCH_START else "15:00-00:00"
 
-        status_parts = []
         if self._tomorrow_data_available:
-            status_parts.append("tomorrow data available")
+            tomorrow_status = "tomorrow data available"
         elif time_window == "before 13:00":
-            status_parts.append("too early for tomorrow data")
+            tomorrow_status = "too early for tomorrow data"
         else:
-            status_parts.append("waiting for tomorrow data")
+            tomorrow_status = "waiting for tomorrow data"
 
         # Add information about last update
         if self._last_full_update:
-            minutes_ago = (now - self._last_full_update).total_seconds() / 60
-            status_parts.append(f"last update {minutes_ago:.1f} min ago")
-
-        # Detailed log at debug level
-        self.logger.debug(
-            "STATUS: API state: %s (%s, time window: %s)",
-            state.value,
-            ", ".join(status_parts),
-            time_window,
-        )
-
-        # Check if basic data exists - log at INFO level for missing data
-        if not self._data_cache.get("user_info") or not self._data_cache.get("homes"):
-            self.logger.info("CACHE STATUS: Missing basic user data, initialization needed")
-        elif self._is_missing_today_data():
-            self.logger.info("CACHE STATUS: Missing today's price data, fetch required")
+            self.logger.debug(
+                "STATUS: API state: %s (%s, last update %.1f min ago, time window: %s)",
+                state.value,
+                tomorrow_status,
+                (now - self._last_full_update).total_seconds() / 60,
+                time_window,
+            )
         else:
-            self.logger.debug("CACHE STATUS: Basic data and today's prices available")
+            self.logger.debug("STATUS: API state: %s (%s, time window: %s)", state.value, tomorrow_status, time_window)
 
     async def _fetch_basic_data(self, client: TibberPricesApiClient, data: dict[str, Any]) -> None:
         """Fetch basic user and home data if needed."""
-        if not data.get("user_info") or not data.get("homes"):
-            self.logger.info("INITIALIZATION PHASE: Fetching user info and homes from API")
-            start_time = dt_util.now()
-            user_data = await client.async_get_user_info()
-            if "viewer" in user_data:
-                data["user_info"] = user_data["viewer"]
-                if "homes" in data["user_info"]:
-                    homes_count = len(data["user_info"]["homes"])
-                    data["homes"] = {home["id"]: home for home in data["user_info"]["homes"]}
-                    duration = (dt_util.now() - start_time).total_seconds()
-                    self.logger.info(
-                        "Initial user data loaded: %d homes from API, account name: %s (in %.3f seconds)",
-                        homes_count,
-                        data["user_info"].get("name", "unknown"),
-                        duration,
-                    )
+        if data.get("user_info") and data.get("homes"):
+            return
+
+        self.logger.info("INITIALIZATION PHASE: Fetching user info and homes from API")
+        start_time = dt_util.now()
+        user_data = await client.async_get_user_info()
+        viewer = user_data.get("viewer")
+        if not viewer:
+            return
+
+        homes = viewer.get("homes") or []
+        data["user_info"] = viewer
+        data["homes"] = _index_homes(homes)
+
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                "Initial user data loaded: %d homes from API, account name: %s (in %.3f seconds)",
+                len(homes),
+                viewer.get("name", "unknown"),
+                (dt_util.now() - start_time).total_seconds(),
+            )
 
     def _log_state_transition(self, previous_state: ApiState) -> None:
         """Log state transition if it changed."""
@@ -799,8 +927,44 @@ class TibberPricesDataUpdateCoordinator(DataUpdateCoordinator):
                 updated_state.value,
             )
 
+    @staticmethod
+    def _count_price_points(price_info: dict[str, Any]) -> tuple[int, int, int, int]:
+        """Count homes and price points for today and tomorrow in a single pass."""
+        homes_with_today = homes_with_tomorrow = price_points_today = price_points_tomorrow = 0
+        for info in price_info.values():
+            if today := info.get("today"):
+                homes_with_today += 1
+                price_points_today += len(today)
+            if tomorrow := info.get("tomorrow"):
+                homes_with_tomorrow += 1
+                price_points_tomorrow += len(tomorrow)
+        return homes_with_today, homes_with_tomorrow, price_points_today, price_points_tomorrow
+
     def _log_data_summary(self, data: dict[str, Any]) -> None:
         """Log a summary of what data was fetched."""
+        if not data:
+            self.logger.warning("No data received from API")
+            return
+
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+
+        price_counts = self._count_price_points(data["price_info"]) if data.get("price_info") else None
+
+        ratings: tuple[str, ...] | None = None
+        if data.get("price_rating"):
+            rating_keys: set[str] = set()
+            for rating in data["price_rating"].values():
+                rating_keys.update(rating)
+            ratings = tuple(period for period in RATING_PERIODS if period in rating_keys)
+
+        # Skip the summary when nothing it reports has changed since the last update
+        signature = (bool(data.get("user_info")), len(data.get("homes") or ()), price_counts, ratings)
+        if signature == self._last_summary_sig:
+            self.logger.debug("DATA UPDATE SUMMARY: unchanged")
+            return
+        self._last_summary_sig = signature
+
         # Create sections for different data types
         sections = []
 
@@ -809,36 +973,19 @@ class TibberPricesDataUpdateCoordinator(DataUpdateCoordinator):
             sections.append("user info")
 
         if data.get("homes"):
-            home_count = len(data["homes"])
-            sections.append(f"{home_count} homes")
+            sections.append(f"{len(data['homes'])} homes")
 
         # Price info section with details
-        if data.get("price_info"):
-            homes_with_today = sum(1 for info in data["price_info"].values() if info.get("today"))
-            homes_with_tomorrow = sum(1 for info in data["price_info"].values() if info.get("tomorrow"))
-
-            # More detailed info for price data
-            price_points_today = sum(len(info.get("today", [])) for info in data["price_info"].values())
-            price_points_tomorrow = sum(len(info.get("tomorrow", [])) for info in data["price_info"].values())
-
+        if price_counts is not None:
+            homes_with_today, homes_with_tomorrow, price_points_today, price_points_tomorrow = price_counts
             sections.append(
                 f"prices (homes with today: {homes_with_today}, tomorrow: {homes_with_tomorrow}, "
                 f"points today: {price_points_today}, tomorrow: {price_points_tomorrow})"
             )
 
         # Ratings section
-        if data.get("price_rating"):
-            ratings = []
-            if any("hourly" in rating for rating in data["price_rating"].values()):
-                ratings.append("hourly")
-            if any("daily" in rating for rating in data["price_rating"].values()):
-                ratings.append("daily")
-            if any("monthly" in rating for rating in data["price_rating"].values()):
-                ratings.append("monthly")
+        if ratings is not None:
             sections.append(f"ratings ({', '.join(ratings)})")
 
         # Log the full data summary
-        if data:
-            self.logger.info("DATA UPDATE SUMMARY: %s", ", ".join(sections))
-        else:
-            self.logger.warning("No data received from API")
+        self.logger.info("DATA UPDATE SUMMARY: %s", ", ".join(sections))
@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left
+from collections import Counter
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import date, datetime
 from enum import Enum
-from typing import TYPE_CHECKING, Any
+from heapq import nsmallest
+from itertools import chain, pairwise
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, TypedDict
 
 from homeassistant.util import dt as dt_util
 
@@ -23,6 +28,8 @@ from .const import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from homeassistant.loader import Integration
 
     from .api import TibberPricesApiClient
@@ -49,6 +56,40 @@ class PriceRatingLevel(str, Enum):
     UNKNOWN = PRICE_RATING_UNKNOWN
 
 
+# Level lookups by lower-case API value, avoiding enum construction and exceptions per price point
+_PRICE_LEVELS: dict[str, PriceLevel] = {level.value: level for level in PriceLevel}
+_PRICE_RATING_LEVELS: dict[str, PriceRatingLevel] = {level.value: level for level in PriceRatingLevel}
+
+
+# Sort key for the cheapest price queries
+_PRICE_TOTAL = attrgetter("total")
+
+
+def _start_times_if_sorted(prices: list[PriceInfo]) -> list[datetime] | None:
+    """Return the start times of the prices for bisecting, or None if the prices are not in chronological order."""
+    start_times = [price.starts_at for price in prices]
+    if all(earlier <= later for earlier, later in pairwise(start_times)):
+        return start_times
+    return None
+
+
+def _prices_starting_from(
+    prices: list[PriceInfo], start_times: list[datetime] | None, now: datetime
+) -> list[PriceInfo]:
+    """Return the prices starting at or after now, bisecting the start times when they are sorted."""
+    if start_times is None:
+        return [price for price in prices if price.starts_at >= now]
+    return prices[bisect_left(start_times, now) :]
+
+
+def _parse_api_datetime(value: str) -> datetime:
+    """Parse an ISO-8601 timestamp from the API, falling back to the current time if it is invalid."""
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return dt_util.parse_datetime(value) or datetime.now(dt_util.DEFAULT_TIME_ZONE)
+
+
 @dataclass
 class TibberPricesConfigEntry:
     """Type definition for TibberPrices config entry."""
@@ -58,7 +99,7 @@ class TibberPricesConfigEntry:
     integration: Integration
 
 
-class TibberAddress(dict):
+class TibberAddress(TypedDict, total=False):
     """Tibber address data."""
 
     address1: str
@@ -67,7 +108,7 @@ class TibberAddress(dict):
     country: str
 
 
-class TibberHome(dict):
+class TibberHome(TypedDict, total=False):
     """Tibber home data."""
 
     id: str
@@ -76,7 +117,7 @@ class TibberHome(dict):
     address: TibberAddress
 
 
-class TibberUser(dict):
+class TibberUser(TypedDict, total=False):
     """Tibber user data."""
 
     user_id: str
@@ -85,13 +126,13 @@ class TibberUser(dict):
     homes: list[TibberHome]
 
 
-class TibberViewer(dict):
+class TibberViewer(TypedDict, total=False):
     """Tibber viewer data."""
 
     viewer: TibberUser
 
 
-@dataclass
+@dataclass(slots=True)
 class PriceInfo:
     """Price information for a single price point."""
 
@@ -105,22 +146,14 @@ class PriceInfo:
     @classmethod
     def from_api_response(cls, data: dict[str, Any], currency: str = "") -> PriceInfo:
         """Create PriceInfo from API response data."""
-        starts_at = dt_util.parse_datetime(data["startsAt"])
-        if starts_at is None:
-            starts_at = datetime.now(dt_util.DEFAULT_TIME_ZONE)
-
-        level_str = data.get("level", PRICE_LEVEL_UNKNOWN)
-        try:
-            level = PriceLevel(level_str)
-        except ValueError:
-            level = PriceLevel.UNKNOWN
+        level_str = data.get("level") or PRICE_LEVEL_UNKNOWN
 
         return cls(
-            starts_at=starts_at,
+            starts_at=_parse_api_datetime(data["startsAt"]),
             total=float(data.get("total", 0.0)),
             energy=float(data.get("energy", 0.0)),
             tax=float(data.get("tax", 0.0)),
-            level=level,
+            level=_PRICE_LEVELS.get(level_str.lower(), PriceLevel.UNKNOWN),
             currency=currency,
         )
 
@@ -134,13 +167,9 @@ class PriceInfoRange:
     @classmethod
     def from_range_response(cls, data: dict[str, Any], currency: str = "") -> PriceInfoRange:
         """Create PriceInfoRange from range API response."""
-        result = cls()
-        edges = data.get("edges", [])
-        for edge in edges:
-            node = edge.get("node", {})
-            price_info = PriceInfo.from_api_response(node, currency)
-            result.prices.append(price_info)
-        return result
+        return cls(
+            prices=[PriceInfo.from_api_response(edge.get("node", {}), currency) for edge in data.get("edges", ())]
+        )
 
 
 @dataclass
@@ -153,54 +182,104 @@ class HomeCurrentPriceInfo:
     tomorrow: list[PriceInfo] = field(default_factory=list)
     range_prices: list[PriceInfo] = field(default_factory=list)
     currency: str = ""
-
-    def get_current_price(self) -> PriceInfo | None:
-        """Get the current price information."""
-        now = datetime.now(dt_util.DEFAULT_TIME_ZONE)
+    # Lookup indexes and today's average built from the price lists, rebuilt when a list is replaced or changes length
+    _index_token: tuple[tuple[list[PriceInfo], int], ...] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _today_by_hour: dict[int, PriceInfo] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _by_hour: dict[tuple[date, int], PriceInfo] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _today_avg: float = field(default=0.0, init=False, repr=False, compare=False)
+    _today_starts: list[datetime] | None = field(default=None, init=False, repr=False, compare=False)
+    _tomorrow_starts: list[datetime] | None = field(default=None, init=False, repr=False, compare=False)
+    # Results of the future price queries, valid for the hour they were computed in
+    _future_cache: dict[tuple[str, int], list[PriceInfo]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _future_cache_key: tuple[datetime, bool] | None = field(default=None, init=False, repr=False, compare=False)
+
+    def _ensure_index(self) -> None:
+        """Build the hour lookup indexes if the price lists changed since they were last built."""
+        price_lists = (self.today, self.tomorrow, self.range_prices)
+        # Compared by identity, comparing replaced lists with == would compare all of their prices
+        if self._index_token is not None and all(
+            prices is indexed and len(prices) == indexed_len
+            for prices, (indexed, indexed_len) in zip(price_lists, self._index_token, strict=True)
+        ):
+            return
+
+        # Insert in reverse priority so the first match in today, then tomorrow, then range prices wins
+        self._today_by_hour = {price.starts_at.hour: price for price in reversed(self.today)}
+        self._by_hour = {}
+        for prices in (self.range_prices, self.tomorrow, self.today):
+            self._by_hour.update(((price.starts_at.date(), price.starts_at.hour), price) for price in reversed(prices))
+        self._today_avg = sum(price.total for price in self.today) / len(self.today) if self.today else 0.0
+        self._today_starts = _start_times_if_sorted(self.today)
+        self._tomorrow_starts = _start_times_if_sorted(self.tomorrow)
+        self._future_cache.clear()
+        self._index_token = tuple((prices, len(prices)) for prices in price_lists)
+
+    def get_today_average(self) -> float:
+        """Get the average total price of today, or 0.0 without prices for today."""
+        self._ensure_index()
+        return self._today_avg
+
+    def _get_future_prices(self, now: datetime, query: str, num_hours: int) -> list[PriceInfo]:
+        """
+        Get the result of a future price query, computing it at most once per hour.
+
+        Prices start on the hour, so the prices starting at or after now only change when the hour changes.
+        Exactly on the hour, the price starting now is still included.
+        """
+        self._ensure_index()
+        hour_start = now.replace(minute=0, second=0, microsecond=0)
+        cache_key = (hour_start, now == hour_start)
+        if cache_key != self._future_cache_key:
+            self._future_cache.clear()
+            self._future_cache_key = cache_key
+
+        result = self._future_cache.get((query, num_hours))
+        if result is None:
+            future_prices: Iterable[PriceInfo] = _prices_starting_from(self.today, self._today_starts, now)
+            if query != "today":
+                future_prices = chain(future_prices, _prices_starting_from(self.tomorrow, self._tomorrow_starts, now))
+            # Same result as sorting by total price and slicing, without sorting all future prices
+            result = nsmallest(num_hours, future_prices, key=_PRICE_TOTAL)
+            self._future_cache[query, num_hours] = result
+        return list(result)
+
+    def get_current_price(self, now: datetime | None = None) -> PriceInfo | None:
+        """Get the current price information, optionally for a reference time already determined by the caller."""
+        now = now or datetime.now(dt_util.DEFAULT_TIME_ZONE)
         if self.current and self.current.starts_at.hour == now.hour:
             return self.current
 
         # Find the current price from today's prices
-        for price in self.today:
-            if price.starts_at.hour == now.hour:
-                self.current = price
-                return price
-
-        return None
+        self._ensure_index()
+        price = self._today_by_hour.get(now.hour)
+        if price is not None:
+            self.current = price
+        return price
 
     def get_price_at(self, target_time: datetime) -> PriceInfo | None:
         """Get price information at a specific time."""
         if not target_time.tzinfo:
             target_time = target_time.replace(tzinfo=dt_util.DEFAULT_TIME_ZONE)
 
-        # Check in today's prices
-        for price in self.today:
-            if price.starts_at.hour == target_time.hour and price.starts_at.date() == target_time.date():
-                return price
+        # Look up today's, tomorrow's and range prices, in that order of priority
+        self._ensure_index()
+        return self._by_hour.get((target_time.date(), target_time.hour))
 
-        # Check in tomorrow's prices
-        for price in self.tomorrow:
-            if price.starts_at.hour == target_time.hour and price.starts_at.date() == target_time.date():
-                return price
-
-        # Check in range prices
-        for price in self.range_prices:
-            if price.starts_at.hour == target_time.hour and price.starts_at.date() == target_time.date():
-                return price
-
-        return None
-
-    def get_cheapest_hours(self, num_hours: int = 1) -> list[PriceInfo]:
+    def get_cheapest_hours(self, num_hours: int = 1, now: datetime | None = None) -> list[PriceInfo]:
         """Get the cheapest hours within the next 24 hours."""
-        now = datetime.now(dt_util.DEFAULT_TIME_ZONE)
-        future_hours = [price for price in self.today + self.tomorrow if price.starts_at >= now]
+        return self._get_future_prices(now or datetime.now(dt_util.DEFAULT_TIME_ZONE), "next_24h", num_hours)
 
-        # Sort by total price and return the cheapest ones
-        future_hours.sort(key=lambda p: p.total)
-        return future_hours[:num_hours]
+    def get_cheapest_price_today(self, now: datetime | None = None) -> PriceInfo | None:
+        """Get the cheapest price for the rest of today."""
+        cheapest = self._get_future_prices(now or datetime.now(dt_util.DEFAULT_TIME_ZONE), "today", 1)
+        return cheapest[0] if cheapest else None
 
 
-@dataclass
+@dataclass(slots=True)
 class PriceRatingThresholds:
     """Price rating thresholds."""
 
@@ -216,7 +295,7 @@ class PriceRatingThresholds:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class PriceRatingEntry:
     """Price rating entry data."""
 
@@ -230,32 +309,19 @@ class PriceRatingEntry:
     @classmethod
     def from_api_response(cls, data: dict[str, Any]) -> PriceRatingEntry:
         """Create PriceRatingEntry from API response data."""
-        time_str = data.get("time", "")
-        time = dt_util.parse_datetime(time_str)
-        if time is None:
-            time = datetime.now(dt_util.DEFAULT_TIME_ZONE)
-
-        level_str = data.get("level", "").lower()
-        if level_str == "low":
-            level = PriceRatingLevel.LOW
-        elif level_str == "high":
-            level = PriceRatingLevel.HIGH
-        elif level_str == "normal":
-            level = PriceRatingLevel.NORMAL
-        else:
-            level = PriceRatingLevel.UNKNOWN
+        level_str = data.get("level") or PRICE_RATING_UNKNOWN
 
         return cls(
-            time=time,
+            time=_parse_api_datetime(data.get("time", "")),
             total=float(data.get("total", 0.0)),
             energy=float(data.get("energy", 0.0)),
             tax=float(data.get("tax", 0.0)),
             difference=float(data.get("difference", 0.0)),
-            level=level,
+            level=_PRICE_RATING_LEVELS.get(level_str.lower(), PriceRatingLevel.UNKNOWN),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class PriceRatingPeriod:
     """Price rating period data."""
 
@@ -265,14 +331,13 @@ class PriceRatingPeriod:
     @classmethod
     def from_api_response(cls, data: dict[str, Any]) -> PriceRatingPeriod:
         """Create PriceRatingPeriod from API response data."""
-        result = cls(currency=data.get("currency", ""))
-        for entry_data in data.get("entries", []):
-            entry = PriceRatingEntry.from_api_response(entry_data)
-            result.entries.append(entry)
-        return result
+        return cls(
+            currency=data.get("currency", ""),
+            entries=[PriceRatingEntry.from_api_response(entry_data) for entry_data in data.get("entries", ())],
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class HomePriceRating:
     """Price rating for a home."""
 
@@ -281,42 +346,52 @@ class HomePriceRating:
     hourly: PriceRatingPeriod | None = None
     daily: PriceRatingPeriod | None = None
     monthly: PriceRatingPeriod | None = None
-
-    def get_current_rating(self) -> PriceRatingEntry | None:
-        """Get the current price rating."""
+    # Hourly entries indexed by date and hour, rebuilt when the entry list is replaced or changes length
+    _hourly_token: tuple[list[PriceRatingEntry], int] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _hourly_by_hour: dict[tuple[date, int], PriceRatingEntry] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # Average total per day of the daily entries, rebuilt when the entry list is replaced or changes length
+    _daily_token: tuple[list[PriceRatingEntry], int] | None = field(default=None, init=False, repr=False, compare=False)
+    _daily_averages: dict[date, float] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def get_current_rating(self, now: datetime | None = None) -> PriceRatingEntry | None:
+        """Get the current price rating, optionally for a reference time already determined by the caller."""
         if not self.hourly or not self.hourly.entries:
             return None
 
-        now = datetime.now(dt_util.DEFAULT_TIME_ZONE)
-        for entry in self.hourly.entries:
-            if entry.time.hour == now.hour and entry.time.date() == now.date():
-                return entry
+        entries = self.hourly.entries
+        token = self._hourly_token
+        if token is None or token[0] is not entries or token[1] != len(entries):
+            # Reversed so the first entry for an hour wins
+            self._hourly_by_hour = {(entry.time.date(), entry.time.hour): entry for entry in reversed(entries)}
+            self._hourly_token = (entries, len(entries))
 
-        return None
+        now = now or datetime.now(dt_util.DEFAULT_TIME_ZONE)
+        return self._hourly_by_hour.get((now.date(), now.hour))
 
     def get_day_average(self, target_date: datetime | None = None) -> float:
         """Get the average price for a specific day."""
         if not self.daily or not self.daily.entries:
             return 0.0
 
+        entries = self.daily.entries
+        token = self._daily_token
+        if token is None or token[0] is not entries or token[1] != len(entries):
+            totals: dict[date, list[float]] = {}
+            for entry in entries:
+                totals.setdefault(entry.time.date(), []).append(entry.total)
+            self._daily_averages = {day: sum(day_totals) / len(day_totals) for day, day_totals in totals.items()}
+            self._daily_token = (entries, len(entries))
+
         if target_date is None:
             target_date = datetime.now(dt_util.DEFAULT_TIME_ZONE)
-
-        total_sum = 0.0
-        count = 0
-
-        for entry in self.daily.entries:
-            if entry.time.date() == target_date.date():
-                total_sum += entry.total
-                count += 1
-
-        if count > 0:
-            return total_sum / count
-
-        return 0.0
+        return self._daily_averages.get(target_date.date(), 0.0)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TibberPricesData:
     """Data for the TibberPrices integration."""
 
@@ -340,35 +415,26 @@ class TibberPricesData:
             result.append((home_id, name))
         return result
 
-    def get_cheapest_time_today(self, home_id: str) -> datetime | None:
+    def get_cheapest_time_today(self, home_id: str, now: datetime | None = None) -> datetime | None:
         """Get the cheapest time to run appliances today."""
         if home_id not in self.price_info:
             return None
 
-        price_info = self.price_info[home_id]
-        now = datetime.now(dt_util.DEFAULT_TIME_ZONE)
-        future_prices = [p for p in price_info.today if p.starts_at >= now]
-
-        if not future_prices:
-            return None
-
-        cheapest = min(future_prices, key=lambda p: p.total)
-        return cheapest.starts_at
+        cheapest = self.price_info[home_id].get_cheapest_price_today(now)
+        return cheapest.starts_at if cheapest else None
 
-    def calculate_price_difference(self, home_id: str) -> float | None:
+    def calculate_price_difference(self, home_id: str, now: datetime | None = None) -> float | None:
         """Calculate the price difference from average (in percentage)."""
         if home_id not in self.price_info:
             return None
 
         price_info = self.price_info[home_id]
-        current = price_info.get_current_price()
+        current = price_info.get_current_price(now)
 
         if not current or not price_info.today:
             return None
 
-        # Calculate the average price for today
-        total = sum(p.total for p in price_info.today)
-        avg = total / len(price_info.today)
+        avg = price_info.get_today_average()
 
         if avg == 0:
             return 0
@@ -380,20 +446,8 @@ class TibberPricesData:
         if home_id not in self.price_info:
             return {}
 
-        price_info = self.price_info[home_id]
-        result = {
-            PriceLevel.VERY_CHEAP: 0,
-            PriceLevel.CHEAP: 0,
-            PriceLevel.NORMAL: 0,
-            PriceLevel.EXPENSIVE: 0,
-            PriceLevel.VERY_EXPENSIVE: 0,
-            PriceLevel.UNKNOWN: 0,
-        }
-
-        for price in price_info.today:
-            result[price.level] += 1
-
-        return result
+        counts = Counter(map(attrgetter("level"), self.price_info[home_id].today))
+        return {level: counts[level] for level in PriceLevel}
 
     def get_rating_distribution(self, home_id: str) -> dict[PriceRatingLevel, int]:
         """Get distribution of price rating levels for today."""
@@ -404,14 +458,5 @@ class TibberPricesData:
         if not price_rating.daily or not price_rating.daily.entries:
             return {}
 
-        result = {
-            PriceRatingLevel.LOW: 0,
-            PriceRatingLevel.NORMAL: 0,
-            PriceRatingLevel.HIGH: 0,
-            PriceRatingLevel.UNKNOWN: 0,
-        }
-
-        for entry in price_rating.daily.entries:
-            result[entry.level] += 1
-
-        return result
+        counts = Counter(map(attrgetter("level"), price_rating.daily.entries))
+        return {level: counts[level] for level in PriceRatingLevel}
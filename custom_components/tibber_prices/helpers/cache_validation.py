@@ -1,20 +1,69 @@
 """Helper module for advanced cache validation and repair in Tibber Prices integration."""
 
-from datetime import date, datetime, timedelta
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta, tzinfo
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
 from homeassistant.util import dt as dt_util
 
 from .const import (
+    AFTERNOON_CUTOFF,
     API_SEVERELY_STALE_THRESHOLD_HOURS,
     API_STALE_THRESHOLD_MINUTES,
+    HOURS_IN_DAY,
     MIN_QUARTER_HOUR_BOUNDARY_MINUTES,
 )
+from .data_validation import parse_starts_at
+
+# Bitmask with one bit set per hour of a regular day, bit n standing for hour n
+_FULL_DAY_MASK = (1 << HOURS_IN_DAY) - 1
+
+# Age thresholds of the cached data, see check_for_stale_cache
+_SEVERELY_STALE_DELTA = timedelta(hours=API_SEVERELY_STALE_THRESHOLD_HOURS)
+_STALE_DELTA = timedelta(minutes=API_STALE_THRESHOLD_MINUTES)
+
+# Sections every cached data set must contain
+_REQUIRED_SECTIONS = frozenset(("user_info", "homes", "price_info"))
+
+# Shared read-only result of validate_cache_structure for a cache without issues
+_VALID_STRUCTURE_RESULT: Mapping[str, Any] = MappingProxyType(
+    {
+        "valid": True,
+        "structural_issues": (),
+        "price_structure_issues": (),
+        "data_completeness_issues": (),
+        "needs_full_refresh": False,
+    }
+)
+
+
+def _is_valid_structure(data_cache: dict[str, Any]) -> bool:
+    """Check the cache structure without collecting any details about issues."""
+    if not data_cache or not data_cache.keys() >= _REQUIRED_SECTIONS:
+        return False
+
+    homes = data_cache["homes"]
+    all_price_info = data_cache["price_info"]
+    return (
+        isinstance(data_cache["user_info"], dict)
+        and isinstance(homes, dict)
+        and isinstance(all_price_info, dict)
+        and homes.keys() == all_price_info.keys()
+        and all(
+            isinstance(price_info, dict)
+            and isinstance(price_info.get("today", []), list)
+            and isinstance(price_info.get("tomorrow", []), list)
+            for price_info in all_price_info.values()
+        )
+    )
 
 
 def validate_cache_structure(
     data_cache: dict[str, Any],
-) -> dict[str, Any]:
+) -> Mapping[str, Any]:
     """
     Perform deep validation of cache structure to detect corrupted data.
 
@@ -23,9 +72,17 @@ def validate_cache_structure(
         logger: Logger instance
 
     Returns:
-        Dictionary with validation results and details about issues
+        Mapping with validation results and details about issues, read-only if there are none
 
     """
+    # Fast path for the common case of a valid cache, details are only collected when there are issues
+    if _is_valid_structure(data_cache):
+        return _VALID_STRUCTURE_RESULT
+    return _collect_structure_issues(data_cache)
+
+
+def _collect_structure_issues(data_cache: dict[str, Any]) -> dict[str, Any]:
+    """Validate the cache structure in detail, collecting every issue found."""
     result = {
         "valid": True,
         "structural_issues": [],
@@ -42,50 +99,50 @@ def validate_cache_structure(
         return result
 
     # 2. Check essential sections exist
-    required_sections = ["user_info", "homes", "price_info"]
-    missing_sections = [section for section in required_sections if section not in data_cache]
-
+    missing_sections = _REQUIRED_SECTIONS - data_cache.keys()
     if missing_sections:
         result["valid"] = False
-        result["structural_issues"].append(f"Missing required sections: {', '.join(missing_sections)}")
+        result["structural_issues"].append(f"Missing required sections: {', '.join(sorted(missing_sections))}")
         result["needs_full_refresh"] = True
         return result
 
+    homes = data_cache["homes"]
+    all_price_info = data_cache["price_info"]
+
     # 3. Check user_info structure
-    if not isinstance(data_cache.get("user_info"), dict):
+    if not isinstance(data_cache["user_info"], dict):
         result["valid"] = False
         result["structural_issues"].append("Invalid user_info structure - not a dictionary")
         result["needs_full_refresh"] = True
 
     # 4. Check homes structure
-    if not isinstance(data_cache.get("homes"), dict):
+    homes_valid = isinstance(homes, dict)
+    if not homes_valid:
         result["valid"] = False
         result["structural_issues"].append("Invalid homes structure - not a dictionary")
         result["needs_full_refresh"] = True
 
     # 5. Check price_info structure
-    if not isinstance(data_cache.get("price_info"), dict):
+    if not isinstance(all_price_info, dict):
         result["valid"] = False
         result["structural_issues"].append("Invalid price_info structure - not a dictionary")
         result["needs_full_refresh"] = True
         return result
 
     # 6. Check home_id consistency between homes and price_info
-    home_ids_in_homes = set(data_cache.get("homes", {}).keys())
-    home_ids_in_price_info = set(data_cache.get("price_info", {}).keys())
-
-    missing_in_price_info = home_ids_in_homes - home_ids_in_price_info
-    if missing_in_price_info:
-        result["valid"] = False
-        result["structural_issues"].append(f"Homes missing from price_info: {', '.join(missing_in_price_info)}")
+    if homes_valid:
+        missing_in_price_info = homes.keys() - all_price_info.keys()
+        if missing_in_price_info:
+            result["valid"] = False
+            result["structural_issues"].append(f"Homes missing from price_info: {', '.join(missing_in_price_info)}")
 
-    extra_in_price_info = home_ids_in_price_info - home_ids_in_homes
-    if extra_in_price_info:
-        result["valid"] = False
-        result["structural_issues"].append(f"Unknown home IDs in price_info: {', '.join(extra_in_price_info)}")
+        extra_in_price_info = all_price_info.keys() - homes.keys()
+        if extra_in_price_info:
+            result["valid"] = False
+            result["structural_issues"].append(f"Unknown home IDs in price_info: {', '.join(extra_in_price_info)}")
 
     # 7. Check each home's price data structure
-    for home_id, price_info in data_cache.get("price_info", {}).items():
+    for home_id, price_info in all_price_info.items():
         # Check price_info is a dictionary
         if not isinstance(price_info, dict):
             result["valid"] = False
@@ -103,14 +160,26 @@ def validate_cache_structure(
     return result
 
 
+@dataclass(slots=True, frozen=True)
+class HomeCompleteness:
+    """Completeness of a single home's price data."""
+
+    has_today: bool
+    has_tomorrow: bool
+    today_complete: bool = True
+    missing_hours: tuple[int, ...] = ()
+    current_missing: tuple[int, ...] = ()
+    current_missing_mask: int = 0
+
+
 # Helper functions to break down complexity of check_price_data_completeness
 def _process_home_price_data(
     home_price_info: dict[str, Any],
     current_date: date,
     current_hour: int,
     now: datetime,
-    all_homes_hour_counts: dict[int, int],
-) -> dict[str, Any]:
+    all_homes_hour_counts: list[int],
+) -> HomeCompleteness:
     """
     Process a single home's price data and check for completeness.
 
@@ -120,111 +189,116 @@ def _process_home_price_data(
         current_date: The current date
         current_hour: The current hour
         now: The current datetime
-        all_homes_hour_counts: Dictionary to count hours across all homes
+        all_homes_hour_counts: Per-hour counts across all homes, indexed by hour
 
     Returns:
-        Dictionary with results for this home
+        Completeness result for this home
 
     """
-    home_result = {
-        "today_complete": True,
-        "has_today": "today" in home_price_info and home_price_info["today"],
-        "has_tomorrow": "tomorrow" in home_price_info and home_price_info["tomorrow"],
-        "missing_hours": [],
-    }
+    has_today = bool(home_price_info.get("today"))
+    has_tomorrow = bool(home_price_info.get("tomorrow"))
 
     # If home has no today data, mark as incomplete
-    if not home_result["has_today"]:
-        home_result["today_complete"] = False
-        return home_result
+    if not has_today:
+        return HomeCompleteness(has_today=False, has_tomorrow=has_tomorrow, today_complete=False)
 
-    # Process today's data and check completeness
-    hours_found = set()
+    # Process today's data and check completeness, tracking the hours found as bits of a mask
+    found_mask = 0
     for price in home_price_info["today"]:
-        starts_at = dt_util.parse_datetime(price.get("startsAt", ""))
+        starts_at = parse_starts_at(price.get("startsAt", ""))
         if starts_at and starts_at.date() == current_date:
             hour = starts_at.hour
-            hours_found.add(hour)
+            found_mask |= 1 << hour
 
             # Count this hour across all homes
-            if hour not in all_homes_hour_counts:
-                all_homes_hour_counts[hour] = 0
             all_homes_hour_counts[hour] += 1
 
-    # Get expected hours based on DST status
-    expected_hours = _get_expected_hours(now, hours_found)
-
-    # Check for missing hours
-    missing_hours = expected_hours - hours_found
-    home_result["missing_hours"] = sorted(missing_hours)
+    # Check for missing hours based on DST status
+    missing_mask = _get_expected_hours_mask(now) & ~found_mask
+    if not missing_mask:
+        return HomeCompleteness(has_today=True, has_tomorrow=has_tomorrow)
 
     # Check if any hours up to the current hour are missing
-    current_missing = [h for h in missing_hours if h <= current_hour]
-    if current_missing:
-        home_result["today_complete"] = False
-        home_result["current_missing"] = current_missing
-
-    return home_result
-
-
-def _get_expected_hours(now: datetime, hours_found: set[int]) -> set[int]:
+    current_missing_mask = missing_mask & ((2 << current_hour) - 1)
+    return HomeCompleteness(
+        has_today=True,
+        has_tomorrow=has_tomorrow,
+        today_complete=not current_missing_mask,
+        missing_hours=_hours_in_mask(missing_mask),
+        current_missing=_hours_in_mask(current_missing_mask),
+        current_missing_mask=current_missing_mask,
+    )
+
+
+def _get_expected_hours_mask(now: datetime) -> int:
     """
-    Get the expected set of hours for a day, adjusting for DST transitions.
+    Get the bitmask of expected hours for a day, adjusting for DST transitions.
 
     Args:
         now: Current datetime
-        hours_found: Set of hours found in the data
 
     Returns:
-        Set of expected hours for the day
+        Bitmask of expected hours for the day
 
     """
+    # On spring-forward days the skipped wall-clock hour has no price
+    skipped_hour = _get_skipped_hour(now.date(), now.tzinfo) if now.tzinfo else None
+    if skipped_hour is not None:
+        return _FULL_DAY_MASK & ~(1 << skipped_hour)
+
     # Default expectation is 24 hours
-    expected_hours = set(range(24))
+    return _FULL_DAY_MASK
 
-    # Check for DST transition
-    from .const import HOURS_IN_DAY
-    from .data_validation import is_dst_transition_day, is_spring_forward
 
-    is_dst_day = is_dst_transition_day(now)
-    if is_dst_day and is_spring_forward(now):
-        # Find the missing hour for spring forward
-        for h in range(HOURS_IN_DAY):
-            if (
-                h not in hours_found
-                and (h > 0 and h - 1 in hours_found)
-                and (h < HOURS_IN_DAY - 1 and h + 1 in hours_found)
-            ):
-                # This is likely the DST transition hour
-                expected_hours.remove(h)
-                break
+@lru_cache(maxsize=8)
+def _get_skipped_hour(day: date, tz: tzinfo) -> int | None:
+    """
+    Get the wall-clock hour that does not exist on a day because of a DST spring-forward transition.
 
-    return expected_hours
+    Args:
+        day: The local date to check
+        tz: The time zone of the day
+
+    Returns:
+        The skipped hour, or None if every hour of the day exists
+
+    """
+    for hour in range(HOURS_IN_DAY):
+        wall_time = datetime.combine(day, time(hour), tzinfo=tz)
+        # A nonexistent wall time does not survive the round trip through UTC
+        if wall_time.astimezone(dt_util.UTC).astimezone(tz).hour != hour:
+            return hour
+    return None
 
 
-def _find_missing_hour_ranges(missing_hours: list[int]) -> list[str]:
+def _hours_in_mask(mask: int) -> tuple[int, ...]:
+    """Return the sorted hours whose bits are set in the mask."""
+    return tuple(hour for hour in range(HOURS_IN_DAY) if mask >> hour & 1)
+
+
+def _find_missing_hour_ranges(missing_mask: int) -> list[str]:
     """
     Find ranges of missing hours for better reporting.
 
     Args:
-        missing_hours: List of missing hour numbers
+        missing_mask: Bitmask of the missing hours
 
     Returns:
         List of strings representing ranges of missing hours
 
     """
-    ranges = []
-    start = None
+    # A range starts at a set bit whose lower neighbour is clear and ends at one whose upper neighbour is clear
+    starts = missing_mask & ~(missing_mask << 1)
+    ends = missing_mask & ~(missing_mask >> 1)
 
-    for h in sorted(missing_hours):
-        if start is None:
-            start = h
-        elif h > start + 1:
-            ranges.append(f"{start}" if start == h - 1 else f"{start}-{h - 1}")
-            start = h
-
-    if start is not None:
-        ranges.append(f"{start}" if start == missing_hours[-1] else f"{start}-{missing_hours[-1]}")
+    ranges = []
+    while starts:
+        start = (starts & -starts).bit_length() - 1
+        end = (ends & -ends).bit_length() - 1
+        ranges.append(f"{start}" if start == end else f"{start}-{end}")
+        # Clear the lowest set bits to move on to the next range
+        starts &= starts - 1
+        ends &= ends - 1
 
     return ranges
 
@@ -263,36 +337,33 @@ def check_price_data_completeness(
     logger.debug("Checking price data completeness for %d homes", len(price_info))
 
     # For counting hours across all homes
-    all_homes_hour_counts = {}
+    all_homes_hour_counts = [0] * HOURS_IN_DAY
 
     # Check if we should expect tomorrow's data
-    afternoon_time = dt_util.parse_time("13:00")
-    expect_tomorrow = False
-    if afternoon_time and now.time() >= afternoon_time:
-        expect_tomorrow = True
+    expect_tomorrow = now.time() >= AFTERNOON_CUTOFF
 
     # Process each home's price data
     for home_id, home_price_info in price_info.items():
         home_result = _process_home_price_data(home_price_info, current_date, current_hour, now, all_homes_hour_counts)
 
         # Update overall result based on this home's data
-        if not home_result["has_today"]:
+        if not home_result.has_today:
             result["complete"] = False
             result["homes_with_missing_today"] += 1
             result["needs_refresh"] = True
-        elif not home_result["today_complete"]:
+        elif not home_result.today_complete:
             result["complete"] = False
             result["homes_with_incomplete_data"] += 1
             result["needs_refresh"] = True
 
             # Find and add missing hour ranges for reporting
-            if "current_missing" in home_result:
-                ranges = _find_missing_hour_ranges(home_result["current_missing"])
+            if home_result.current_missing_mask:
+                ranges = _find_missing_hour_ranges(home_result.current_missing_mask)
                 if ranges:
                     result["missing_hour_ranges"].append(f"Home {home_id}: hours {', '.join(ranges)}")
 
         # Check for tomorrow data (only if we expect it)
-        if expect_tomorrow and not home_result["has_tomorrow"]:
+        if expect_tomorrow and not home_result.has_tomorrow:
             result["complete"] = False
             result["homes_with_missing_tomorrow"] += 1
 
@@ -301,13 +372,12 @@ def check_price_data_completeness(
 
     # Check if we have multiple homes with missing data for the same hour
     # This could indicate a systematic issue rather than per-home problem
-    critical_hours = []
-    for hour, count in all_homes_hour_counts.items():
-        if count < result["total_homes"] * 0.5:  # If more than half of homes missing an hour
-            critical_hours.append(hour)
+    # Hours that some, but fewer than half, of the homes have data for
+    threshold = result["total_homes"] * 0.5
+    critical_hours = [hour for hour, count in enumerate(all_homes_hour_counts) if 0 < count < threshold]
 
     if critical_hours:
-        result["critical_missing_hours"] = sorted(critical_hours)
+        result["critical_missing_hours"] = critical_hours
         result["needs_refresh"] = True
 
     return result
@@ -341,14 +411,13 @@ def check_for_stale_cache(
     time_since_update = now - last_full_update
 
     # Check for severely stale cache
-    if time_since_update > timedelta(hours=API_SEVERELY_STALE_THRESHOLD_HOURS):
+    if time_since_update > _SEVERELY_STALE_DELTA:
         result["is_stale"] = True
         result["reason"] = f"Cache is severely stale ({time_since_update.total_seconds() / 3600:.1f} hours old)"
         result["needs_refresh"] = True
     # Check for moderately stale cache during active hours
-    elif time_since_update > timedelta(minutes=API_STALE_THRESHOLD_MINUTES):
-        afternoon_time = dt_util.parse_time("13:00")
-        if afternoon_time and now.time() >= afternoon_time:
+    elif time_since_update > _STALE_DELTA:
+        if now.time() >= AFTERNOON_CUTOFF:
             result["is_stale"] = True
             result["reason"] = (
                 f"Cache is stale during active hours ({time_since_update.total_seconds() / 60:.1f} minutes old)"
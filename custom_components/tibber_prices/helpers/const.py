@@ -1,5 +1,7 @@
 """Constants for the Tibber Prices helper modules."""
 
+from datetime import time
+
 # Time constants
 HOURS_IN_DAY = 24
 SPRING_FORWARD_HOURS = 23
@@ -13,3 +15,4 @@ MIN_QUARTER_HOUR_BOUNDARY_MINUTES = 5  # Minutes after a quarter-hour boundary t
 # Time windows
 API_STALE_THRESHOLD_MINUTES = 60  # Cache considered stale after this many minutes
 API_SEVERELY_STALE_THRESHOLD_HOURS = 12  # Cache considered severely stale after this many hours
+AFTERNOON_CUTOFF = time(13, 0)  # Tomorrow's prices are expected to be published from this time on
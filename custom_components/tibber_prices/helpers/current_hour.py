@@ -1,6 +1,5 @@
 """Helper module for current hour data validation in Tibber Prices integration."""
 
-import asyncio
 from collections.abc import Callable
 from datetime import datetime
 from typing import Any
@@ -14,7 +13,7 @@ from .data_validation import validate_price_data
 async def check_for_missing_current_hour(
     logger: Any,
     data_cache: dict[str, Any],
-    refresh_method: Callable,
+    schedule_refresh: Callable[[], None],
     last_full_update: datetime | None = None,
 ) -> None:
     """
@@ -23,7 +22,7 @@ async def check_for_missing_current_hour(
     Args:
         logger: Logger instance
         data_cache: The cached data from the coordinator
-        refresh_method: Async method to call to refresh data if needed
+        schedule_refresh: Callback that starts a data refresh without waiting for it
         last_full_update: When the data was last updated
 
     Returns:
@@ -50,8 +49,7 @@ async def check_for_missing_current_hour(
 
         if structure_validation["needs_full_refresh"]:
             logger.info("Scheduling immediate data refresh to fix structural issues")
-            refresh_task = asyncio.create_task(refresh_method())
-            refresh_task.add_done_callback(lambda _: None)
+            schedule_refresh()
             return
 
     # 2. Check for staleness
@@ -62,8 +60,7 @@ async def check_for_missing_current_hour(
 
             if staleness_check["needs_refresh"]:
                 logger.info("Scheduling data refresh to update stale cache")
-                refresh_task = asyncio.create_task(refresh_method())
-                refresh_task.add_done_callback(lambda _: None)
+                schedule_refresh()
                 return
 
     # 3. Check data completeness
@@ -84,25 +81,23 @@ async def check_for_missing_current_hour(
 
         if completeness_check["needs_refresh"]:
             logger.info("Scheduling data refresh to fix incomplete data")
-            refresh_task = asyncio.create_task(refresh_method())
-            refresh_task.add_done_callback(lambda _: None)
+            schedule_refresh()
             return
 
     # 4. Traditional price data validation (most specific)
     validation_result = validate_price_data(data_cache["price_info"], current_date, current_hour, now, logger)
 
-    if not validation_result["valid"]:
+    if not validation_result.valid:
         logger.warning(
             "Cache validation failed. Issues detected: %d/%d homes have problems. Forcing refresh.",
-            validation_result["homes_with_issues"],
-            validation_result["total_homes"],
+            validation_result.homes_with_issues,
+            validation_result.total_homes,
         )
 
-        if validation_result["issues"]:
-            logger.warning("Detected issues:\n- %s", "\n- ".join(validation_result["issues"]))
+        if validation_result.issues:
+            logger.warning("Detected issues:\n- %s", "\n- ".join(validation_result.issues))
 
         logger.info("Scheduling immediate data refresh to fix data issues")
-        refresh_task = asyncio.create_task(refresh_method())
-        refresh_task.add_done_callback(lambda _: None)
+        schedule_refresh()
     else:
         logger.debug("Current hour data validation successful - data is current")
@@ -2,21 +2,54 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from datetime import date, datetime, timedelta
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta, tzinfo
+from functools import lru_cache
 from typing import Any
 
 from homeassistant.util import dt as dt_util
 
-# Constants for magic numbers
-HOURS_IN_DAY = 24
-SPRING_FORWARD_HOURS = 23
-FALL_BACK_HOURS = 25
-DUPLICATE_HOUR_COUNT = 2
-SIGNIFICANT_DAYS_OLD = 1
+from .const import DUPLICATE_HOUR_COUNT, FALL_BACK_HOURS, SPRING_FORWARD_HOURS
 
 
-@dataclass
+@lru_cache(maxsize=512)
+def parse_starts_at(starts_at: str) -> datetime | None:
+    """Parse a startsAt timestamp, caching the result as the same strings are checked by every validation pass."""
+    # The API sends plain ISO-8601 timestamps, only fall back to the lenient parser for anything else
+    try:
+        return datetime.fromisoformat(starts_at)
+    except (TypeError, ValueError):
+        return dt_util.parse_datetime(starts_at)
+
+
+@dataclass(slots=True)
+class ValidationResult:
+    """Result of a price data validation step."""
+
+    valid: bool = True
+    issues: list[str] = field(default_factory=list)
+
+    def add_issue(self, issue: str) -> None:
+        """Record an issue, marking the result as invalid."""
+        self.valid = False
+        self.issues.append(issue)
+
+    def merge(self, other: ValidationResult) -> None:
+        """Take over the validity and issues of another result."""
+        if not other.valid:
+            self.valid = False
+            self.issues.extend(other.issues)
+
+
+@dataclass(slots=True)
+class PriceDataValidationResult(ValidationResult):
+    """Result of validating the price data of all homes."""
+
+    total_homes: int = 0
+    homes_with_issues: int = 0
+
+
+@dataclass(slots=True)
 class ValidationContext:
     """Context for price data validation."""
 
@@ -24,6 +57,54 @@ class ValidationContext:
     current_hour: int
     now: datetime
     logger: Any
+    is_dst_day: bool = field(init=False)
+    # Index of the today list it was built from, shared between the checks of a home
+    today_index: tuple[list[dict[str, Any]], TodayPriceIndex] | None = field(default=None, init=False)
+
+    def __post_init__(self) -> None:
+        """Check for a DST transition once for all homes."""
+        self.is_dst_day = is_dst_transition_day(self.now)
+
+
+@dataclass(slots=True)
+class TodayPriceIndex:
+    """Today's prices of a home indexed by hour."""
+
+    by_hour: dict[int, dict[str, Any]]
+    hour_frequency: dict[int, int]
+
+
+def index_today_prices(today_prices: list[dict[str, Any]], current_date: date) -> TodayPriceIndex:
+    """
+    Index the prices starting on the current date by hour in a single pass.
+
+    Args:
+        today_prices: List of price data for today
+        current_date: The current date
+
+    Returns:
+        The first price of each hour and how often each hour occurs
+
+    """
+    by_hour: dict[int, dict[str, Any]] = {}
+    hour_frequency: dict[int, int] = {}
+    for price in today_prices:
+        price_time = parse_starts_at(price.get("startsAt", ""))
+        if price_time and price_time.date() == current_date:
+            hour = price_time.hour
+            by_hour.setdefault(hour, price)
+            hour_frequency[hour] = hour_frequency.get(hour, 0) + 1
+    return TodayPriceIndex(by_hour, hour_frequency)
+
+
+def _get_today_index(today_prices: list[dict[str, Any]], context: ValidationContext) -> TodayPriceIndex:
+    """Get the index of today's prices, sharing it between the checks through the validation context."""
+    cached = context.today_index
+    if cached is not None and cached[0] is today_prices:
+        return cached[1]
+    index = index_today_prices(today_prices, context.current_date)
+    context.today_index = (today_prices, index)
+    return index
 
 
 def validate_price_data(
@@ -32,7 +113,7 @@ def validate_price_data(
     current_hour: int,
     now: datetime,
     logger: Any,
-) -> dict[str, Any]:
+) -> PriceDataValidationResult:
     """
     Validate price data for all homes.
 
@@ -44,10 +125,10 @@ def validate_price_data(
         logger: Logger instance
 
     Returns:
-        Dictionary with validation results
+        Validation result
 
     """
-    result = {"valid": True, "total_homes": len(price_info), "homes_with_issues": 0, "issues": []}
+    result = PriceDataValidationResult(total_homes=len(price_info))
 
     # Create validation context
     context = ValidationContext(
@@ -61,10 +142,9 @@ def validate_price_data(
     for home_id, home_price_info in price_info.items():
         home_result = validate_home_price_data(home_id, home_price_info, context)
 
-        if not home_result["valid"]:
-            result["valid"] = False
-            result["homes_with_issues"] += 1
-            result["issues"].extend(home_result["issues"])
+        if not home_result.valid:
+            result.homes_with_issues += 1
+            result.merge(home_result)
 
     return result
 
@@ -73,7 +153,7 @@ def validate_home_price_data(
     home_id: str,
     price_info: dict[str, Any],
     context: ValidationContext,
-) -> dict[str, Any]:
+) -> ValidationResult:
     """
     Validate price data for a single home.
 
@@ -83,93 +163,74 @@ def validate_home_price_data(
         context: Validation context with date, time and logger
 
     Returns:
-        Dictionary with validation results for this home
+        Validation result for this home
 
     """
-    result = {"valid": True, "issues": []}
+    result = ValidationResult()
 
     # Step 1: Check if today data exists
-    if not price_info.get("today"):
+    today_prices = price_info.get("today")
+    if not today_prices:
         # No today data
-        result["valid"] = False
-        result["issues"].append(f"Home {home_id} has no 'today' data at all")
+        result.add_issue(f"Home {home_id} has no 'today' data at all")
         return result
 
     try:
         # Step 2: Validate basic data structure
-        valid_structure = _validate_home_data_structure(home_id, price_info, context.logger)
-        if not valid_structure["valid"]:
-            result["valid"] = False
-            result["issues"].extend(valid_structure["issues"])
+        valid_structure = _validate_home_data_structure(home_id, today_prices, context.logger)
+        if not valid_structure.valid:
+            result.merge(valid_structure)
             return result
 
         # Step 3: Validate the date of the data
-        valid_date = _validate_home_data_date(home_id, price_info, context.current_date, context.logger)
-        if not valid_date["valid"]:
-            result["valid"] = False
-            result["issues"].extend(valid_date["issues"])
+        valid_date = _validate_home_data_date(home_id, today_prices, context.current_date, context.logger)
+        if not valid_date.valid:
+            result.merge(valid_date)
             return result
 
         # Step 4: Check for current hour data
-        validation_context = {
-            "current_date": context.current_date,
-            "current_hour": context.current_hour,
-            "now": context.now,
-            "logger": context.logger,
-        }
-        current_hour_result = validate_current_hour_data(home_id, price_info["today"], validation_context)
-
-        if not current_hour_result["valid"]:
-            result["valid"] = False
-            result["issues"].extend(current_hour_result["issues"])
+        current_hour_result = validate_current_hour_data(home_id, today_prices, context)
+
+        if not current_hour_result.valid:
+            result.merge(current_hour_result)
 
     except (IndexError, KeyError, ValueError, TypeError) as err:
         context.logger.warning("Error checking price data for home %s: %s", home_id, err)
-        result["valid"] = False
-        result["issues"].append(f"Home {home_id} error: {err!s}")
+        result.add_issue(f"Home {home_id} error: {err!s}")
 
     return result
 
 
 def _validate_home_data_structure(
     home_id: str,
-    price_info: dict[str, Any],
+    today_prices: Any,
     logger: Any,
-) -> dict[str, Any]:
+) -> ValidationResult:
     """
     Validate the structure of a home's price data.
 
     Args:
         home_id: The home ID
-        price_info: The price info data for this home
+        today_prices: The non-empty today data for this home
         logger: Logger instance
 
     Returns:
-        Dictionary with validation results
+        Validation result
 
     """
-    result = {"valid": True, "issues": []}
+    result = ValidationResult()
 
-    # Check if today is a list
-    if not isinstance(price_info["today"], list):
+    # Check if today is a list, it is known not to be empty
+    if not isinstance(today_prices, list):
         logger.warning("Invalid data structure: 'today' is not a list for home %s", home_id)
-        result["valid"] = False
-        result["issues"].append(f"Home {home_id} has invalid data structure")
-        return result
-
-    # Check if today is empty
-    if not price_info["today"]:
-        logger.warning("Empty price data: 'today' list is empty for home %s", home_id)
-        result["valid"] = False
-        result["issues"].append(f"Home {home_id} has empty 'today' data")
+        result.add_issue(f"Home {home_id} has invalid data structure")
         return result
 
     # Check price structure
-    first_price = price_info["today"][0]
+    first_price = today_prices[0]
     if not isinstance(first_price, dict) or "startsAt" not in first_price:
         logger.warning("Invalid price data structure for home %s", home_id)
-        result["valid"] = False
-        result["issues"].append(f"Home {home_id} has invalid price data structure")
+        result.add_issue(f"Home {home_id} has invalid price data structure")
         return result
 
     return result
@@ -177,48 +238,44 @@ def _validate_home_data_structure(
 
 def _validate_home_data_date(
     home_id: str,
-    price_info: dict[str, Any],
+    today_prices: list[dict[str, Any]],
     current_date: date,
     logger: Any,
-) -> dict[str, Any]:
+) -> ValidationResult:
     """
     Validate the date of a home's price data.
 
     Args:
         home_id: The home ID
-        price_info: The price info data for this home
+        today_prices: The validated today data for this home
         current_date: The current date
         logger: Logger instance
 
     Returns:
-        Dictionary with validation results
+        Validation result
 
     """
-    result = {"valid": True, "issues": []}
+    result = ValidationResult()
 
     # Check first price date
-    first_price = price_info["today"][0]
-    starts_at = dt_util.parse_datetime(first_price["startsAt"])
+    starts_at = parse_starts_at(today_prices[0]["startsAt"])
 
     if not starts_at:
         logger.warning("Invalid date format in price data for home %s", home_id)
-        result["valid"] = False
-        result["issues"].append(f"Home {home_id} has invalid date format")
+        result.add_issue(f"Home {home_id} has invalid date format")
         return result
 
-    date_difference = (current_date - starts_at.date()).days
+    date_difference = current_date.toordinal() - starts_at.date().toordinal()
 
     # Check if data is from today
     if date_difference > 0:
         # Data is from a previous day
         logger.warning("Home %s has outdated price data from %d day(s) ago", home_id, date_difference)
-        result["valid"] = False
-        result["issues"].append(f"Home {home_id} has outdated data from {date_difference} day(s) ago")
+        result.add_issue(f"Home {home_id} has outdated data from {date_difference} day(s) ago")
     elif date_difference < 0:
         # Data is from a future day (shouldn't happen, but handle it)
         logger.warning("Home %s has unexpected future price data", home_id)
-        result["valid"] = False
-        result["issues"].append(f"Home {home_id} has unexpected future data")
+        result.add_issue(f"Home {home_id} has unexpected future data")
 
     return result
 
@@ -226,67 +283,43 @@ def _validate_home_data_date(
 def validate_current_hour_data(
     home_id: str,
     today_prices: list[dict[str, Any]],
-    validation_context: dict[str, Any],
-) -> dict[str, Any]:
+    context: ValidationContext,
+) -> ValidationResult:
     """
     Validate price data for the current hour and completeness of the day.
 
     Args:
         home_id: The home ID
         today_prices: List of price data for today
-        validation_context: Dictionary with validation context (current_date, current_hour, now, logger)
+        context: Validation context with date, time and logger
 
     Returns:
-        Dictionary with validation results
+        Validation result
 
     """
-    result = {"valid": True, "issues": []}
+    result = ValidationResult()
 
     # Extract validation context
-    current_date = validation_context["current_date"]
-    current_hour = validation_context["current_hour"]
-    now = validation_context["now"]
-    logger = validation_context["logger"]
-
-    # Check for DST transition
-    is_dst_day = is_dst_transition_day(now)
+    current_hour = context.current_hour
+    logger = context.logger
 
     # Check for current hour
-    has_current_hour = False
-    for price in today_prices:
-        if "startsAt" not in price:
-            continue
-
-        price_time = dt_util.parse_datetime(price["startsAt"])
-        if not price_time:
-            continue
-
-        if price_time.date() == current_date and price_time.hour == current_hour:
-            # Found the current hour data
-            has_current_hour = True
-
-            # Validate price data
-            if "total" not in price or not isinstance(price["total"], (int, float)):
-                logger.warning("Home %s has invalid price data for current hour (%d:00)", home_id, current_hour)
-                result["valid"] = False
-                result["issues"].append(f"Home {home_id} has corrupt price data for hour {current_hour}")
-                return result
-
-            # All checks passed for this hour
-            break
-
-    if not has_current_hour:
-        result["valid"] = False
-        result["issues"].append(f"Home {home_id} is missing current hour ({current_hour}:00) data")
+    current_price = _get_today_index(today_prices, context).by_hour.get(current_hour)
+    if current_price is None:
+        result.add_issue(f"Home {home_id} is missing current hour ({current_hour}:00) data")
+        return result
+
+    # Validate price data
+    if not isinstance(current_price.get("total"), (int, float)):
+        logger.warning("Home %s has invalid price data for current hour (%d:00)", home_id, current_hour)
+        result.add_issue(f"Home {home_id} has corrupt price data for hour {current_hour}")
         return result
 
     # Check for day completeness
-    validation_context["is_dst_day"] = is_dst_day
-    day_completeness = validate_day_completeness(home_id, today_prices, validation_context)
+    day_completeness = validate_day_completeness(home_id, today_prices, context)
 
-    if not day_completeness["valid"]:
-        result["valid"] = False
-        result["issues"].extend(day_completeness["issues"])
+    if not day_completeness.valid:
+        result.merge(day_completeness)
 
     return result
 
@@ -294,28 +327,27 @@ def validate_current_hour_data(
 def validate_day_completeness(
     home_id: str,
     today_prices: list[dict[str, Any]],
-    validation_context: dict[str, Any],
-) -> dict[str, Any]:
+    context: ValidationContext,
+) -> ValidationResult:
     """
     Validate completeness of the day's price data.
 
     Args:
         home_id: The home ID
         today_prices: List of price data for today
-        validation_context: Dictionary with validation context (current_date, current_hour, is_dst_day, now, logger)
+        context: Validation context with date, time, DST status and logger
 
     Returns:
-        Dictionary with validation results
+        Validation result
 
     """
-    result = {"valid": True, "issues": []}
+    result = ValidationResult()
 
     # Extract validation context
-    current_date = validation_context["current_date"]
-    current_hour = validation_context["current_hour"]
-    is_dst_day = validation_context["is_dst_day"]
-    now = validation_context["now"]
-    logger = validation_context["logger"]
+    current_hour = context.current_hour
+    is_dst_day = context.is_dst_day
+    now = context.now
+    logger = context.logger
 
     expected_hours = 24  # Default expectation is 24 hours
 
@@ -324,63 +356,56 @@ def validate_day_completeness(
         expected_hours = 23 if is_spring_forward(now) else 25
 
     # Count actual hours in today's data
-    unique_hours = set()
-    for price in today_prices:
-        price_time = dt_util.parse_datetime(price.get("startsAt", ""))
-        if price_time and price_time.date() == current_date:
-            unique_hours.add(price_time.hour)
+    index = _get_today_index(today_prices, context)
+    unique_hours = len(index.by_hour)
 
     # Check if we have fewer hours than expected
-    if len(unique_hours) < expected_hours:
-        logger.warning(
-            "Home %s has incomplete data for today (%d/%d hours)", home_id, len(unique_hours), expected_hours
-        )
+    if unique_hours < expected_hours:
+        logger.warning("Home %s has incomplete data for today (%d/%d hours)", home_id, unique_hours, expected_hours)
 
-        if current_hour > max(unique_hours or [0]):
+        if current_hour > max(index.by_hour, default=0):
             # If we're past the last hour in the data, refresh
-            result["valid"] = False
-            result["issues"].append(
-                f"Home {home_id} has incomplete day data ({len(unique_hours)}/{expected_hours} hours)"
-            )
+            result.add_issue(f"Home {home_id} has incomplete day data ({unique_hours}/{expected_hours} hours)")
 
     # For DST transition days, check if the data structure looks correct
     if is_dst_day:
-        dst_validation = validate_dst_transition_data(today_prices, now, logger, home_id)
+        dst_validation = validate_dst_transition_data(today_prices, now, logger, home_id, index)
 
-        if not dst_validation["valid"]:
-            result["valid"] = False
-            result["issues"].extend(dst_validation["issues"])
+        if not dst_validation.valid:
+            result.merge(dst_validation)
 
     return result
 
 
-def is_dst_transition_day(now: datetime) -> bool:
-    """Check if today is a DST transition day."""
-    # Get yesterday and tomorrow at the same hour
-    yesterday = now - timedelta(days=1)
-    tomorrow = now + timedelta(days=1)
+@lru_cache(maxsize=8)
+def _get_dst_flags(day: date, tz: tzinfo) -> tuple[bool, bool]:
+    """
+    Get whether a day has a DST transition and whether it springs forward.
 
-    # If the UTC offset changed between yesterday and today or
-    # will change between today and tomorrow, it's a transition day
-    today_offset = now.utcoffset()
-    yesterday_offset = yesterday.utcoffset()
-    tomorrow_offset = tomorrow.utcoffset()
+    Args:
+        day: The local date to check
+        tz: The time zone of the day
 
-    return bool((today_offset != yesterday_offset) or (today_offset != tomorrow_offset))
+    Returns:
+        Tuple of whether the UTC offset changes during the day and whether it increases
 
+    """
+    # Compare the UTC offsets at the start of the day and at the start of the next day
+    start_offset = datetime.combine(day, time(), tzinfo=tz).utcoffset()
+    end_offset = datetime.combine(day + timedelta(days=1), time(), tzinfo=tz).utcoffset()
+    if start_offset is None or end_offset is None:
+        return False, False
+    return start_offset != end_offset, end_offset > start_offset
 
-def is_spring_forward(now: datetime) -> bool:
-    """Check if today is a spring-forward day (lose an hour)."""
-    yesterday = now - timedelta(days=1)
 
-    # Get the UTC offsets
-    today_offset = now.utcoffset()
-    yesterday_offset = yesterday.utcoffset()
+def is_dst_transition_day(now: datetime) -> bool:
+    """Check if today is a DST transition day."""
+    return now.tzinfo is not None and _get_dst_flags(now.date(), now.tzinfo)[0]
 
-    # If today's offset is greater than yesterday's, we sprung forward
-    if today_offset and yesterday_offset:
-        return today_offset > yesterday_offset
-    return False
+
+def is_spring_forward(now: datetime) -> bool:
+    """Check if today is a spring-forward day (lose an hour)."""
+    return now.tzinfo is not None and _get_dst_flags(now.date(), now.tzinfo)[1]
 
 
 def validate_dst_transition_data(
@@ -388,7 +413,8 @@ def validate_dst_transition_data(
     now: datetime,
     logger: Any,
     home_id: str,
-) -> dict[str, Any]:
+    index: TodayPriceIndex | None = None,
+) -> ValidationResult:
     """
     Validate price data during DST transitions.
 
@@ -397,38 +423,21 @@ def validate_dst_transition_data(
         now: Current datetime
         logger: Logger instance
         home_id: Home ID for logging
+        index: Index of today's prices, built from prices if not given
 
     Returns:
-        Dictionary with validation results
+        Validation result
 
     """
-    result = {"valid": True, "issues": []}
-
-    # Sort prices by start time
-    def get_datetime(price: dict[str, Any]) -> datetime:
-        """Parse datetime from price data."""
-        dt = dt_util.parse_datetime(price.get("startsAt", ""))
-        return dt if dt else dt_util.utcnow().replace(1970, 1, 1)
-
-    sorted_prices = sorted(prices, key=get_datetime)
-
-    # Count hours for today
-    today_date = now.date()
-    hours_count = 0
+    result = ValidationResult()
 
-    # Keep track of hour frequency
-    hour_frequency = {}
-
-    for price in sorted_prices:
-        starts_at = dt_util.parse_datetime(price.get("startsAt", ""))
-        if not starts_at or starts_at.date() != today_date:
-            continue
-
-        hours_count += 1
-
-        # Count frequency of each hour
-        hour = starts_at.hour
-        hour_frequency[hour] = hour_frequency.get(hour, 0) + 1
+    # Count hours for today and keep track of hour frequency
+    if index is None:
+        index = index_today_prices(prices, now.date())
+    hour_frequency = index.hour_frequency
+    hours_count = sum(hour_frequency.values())
+    duplicates = {hour: freq for hour, freq in hour_frequency.items() if freq > 1}
+    duplicate_hours = list(duplicates)
 
     # Check if spring forward (expect 23 hours, no duplicates)
     if is_spring_forward(now):
@@ -439,17 +448,14 @@ def validate_dst_transition_data(
                 SPRING_FORWARD_HOURS,
                 hours_count,
             )
-            result["valid"] = False
-            result["issues"].append(
+            result.add_issue(
                 f"Home {home_id} has incorrect hour count for DST spring forward: {hours_count}/{SPRING_FORWARD_HOURS}"
             )
 
         # Check for duplicates (shouldn't have any)
-        duplicate_hours = [h for h, freq in hour_frequency.items() if freq > 1]
         if duplicate_hours:
             logger.warning("DST spring forward: Home %s has unexpected duplicate hours: %s", home_id, duplicate_hours)
-            result["valid"] = False
-            result["issues"].append(
+            result.add_issue(
                 f"Home {home_id} has unexpected duplicate hours during DST spring forward: {duplicate_hours}"
             )
     else:
@@ -461,21 +467,15 @@ def validate_dst_transition_data(
                 FALL_BACK_HOURS,
                 hours_count,
             )
-            result["valid"] = False
-            result["issues"].append(
+            result.add_issue(
                 f"Home {home_id} has incorrect hour count for DST fall back: {hours_count}/{FALL_BACK_HOURS}"
             )
 
-        # Check for exactly one duplicate hour
-        duplicate_hours = [h for h, freq in hour_frequency.items() if freq > 1]
-        expected_duplicates = hour_frequency.get(duplicate_hours[0] if duplicate_hours else 0, 0)
-        if len(duplicate_hours) != 1 or expected_duplicates != DUPLICATE_HOUR_COUNT:
+        # Check for exactly one hour occurring exactly twice
+        if list(duplicates.values()) != [DUPLICATE_HOUR_COUNT]:
             logger.warning(
                 "DST fall back: Home %s expected exactly one duplicate hour, found: %s", home_id, duplicate_hours
             )
-            result["valid"] = False
-            result["issues"].append(
-                f"Home {home_id} has incorrect duplicate hours during DST fall back: {duplicate_hours}"
-            )
+            result.add_issue(f"Home {home_id} has incorrect duplicate hours during DST fall back: {duplicate_hours}")
 
     return result
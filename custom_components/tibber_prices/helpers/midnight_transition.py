@@ -3,7 +3,7 @@
 from datetime import date
 from typing import Any
 
-from homeassistant.util import dt as dt_util
+from .data_validation import parse_starts_at
 
 
 def check_for_missed_midnight_transition(
@@ -35,6 +35,8 @@ def check_for_missed_midnight_transition(
     if not price_info:
         return result
 
+    current_ordinal = current_date.toordinal()
+
     # Check each home's "today" data to see if it matches the current date
     for home_id, home_price_info in price_info.items():
         if not home_price_info.get("today"):
@@ -44,15 +46,18 @@ def check_for_missed_midnight_transition(
         # Check the date of the first price point for "today"
         try:
             first_price = home_price_info["today"][0]
-            starts_at = dt_util.parse_datetime(first_price["startsAt"])
+            starts_at = parse_starts_at(first_price["startsAt"])
+
+            if not starts_at:
+                continue
 
-            if starts_at and starts_at.date() < current_date:
+            # Calculate how many days old the data is
+            days_old = current_ordinal - starts_at.date().toordinal()
+            if days_old > 0:
                 # The "today" data is actually from a previous day
                 result["needs_rotation"] = True
                 result["outdated_homes"] += 1
 
-                # Calculate how many days old the data is
-                days_old = (current_date - starts_at.date()).days
                 if days_old > 1:
                     result["days_old_by_home"][home_id] = days_old
         except (IndexError, KeyError, ValueError) as err:
@@ -84,17 +89,19 @@ def perform_midnight_rotation(
         logger.warning("No data cache available for midnight rotation")
         return
 
-    price_info_count = len(data_cache.get("price_info", {}))
-    homes_with_tomorrow = sum(1 for info in data_cache.get("price_info", {}).values() if info.get("tomorrow"))
+    # Move tomorrow's data to today, counting the homes that had tomorrow data on the way
+    all_price_info = data_cache["price_info"] or {}
+    homes_with_tomorrow = 0
+    for price_info in all_price_info.values():
+        if "tomorrow" in price_info:
+            tomorrow = price_info["tomorrow"]
+            if tomorrow:
+                homes_with_tomorrow += 1
+            price_info["today"] = tomorrow
+            price_info["tomorrow"] = []
 
     logger.info(
-        "Rotating data: Moving tomorrow's prices to today (%d/%d homes have tomorrow data)",
+        "Rotated data: Moved tomorrow's prices to today (%d/%d homes had tomorrow data)",
         homes_with_tomorrow,
-        price_info_count,
+        len(all_price_info),
     )
-
-    # Move tomorrow's data to today
-    for price_info in data_cache.get("price_info", {}).values():
-        if "tomorrow" in price_info:
-            price_info["today"] = price_info["tomorrow"]
-            price_info["tomorrow"] = []